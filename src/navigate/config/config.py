@@ -32,6 +32,8 @@
 import os
 import sys
 import time
+import pickle
+import hashlib
 import shutil
 import platform
 from pathlib import Path
@@ -46,6 +48,7 @@ import yaml
 
 # Local Imports
 from navigate.tools.common_functions import build_ref_name
+from navigate.tools.file_functions import YamlLoader
 
 # Logger Setup
 p = __name__.split(".")[1]
@@ -124,6 +127,66 @@ def get_configuration_paths():
     return [path for path in paths]
 
 
+def load_yaml_config(file_path: Path):
+    """Load a YAML configuration file, reusing a cached parse when possible.
+
+    The parsed content is pickled to the navigate cache directory together with
+    the modification time and size of the YAML file. The cache is reused until
+    either of them changes. If the cache cannot be written, the file is simply
+    parsed.
+
+    Parameters
+    ----------
+    file_path : Path
+        Path to the YAML file.
+
+    Returns
+    -------
+    config_data : dict/list
+        Content of the YAML file.
+
+    Raises
+    ------
+    yaml.YAMLError
+        If the YAML file cannot be parsed.
+    """
+    cache_path = os.path.join(
+        get_navigate_path(),
+        "cache",
+        hashlib.md5(str(file_path.resolve()).encode()).hexdigest() + ".pkl",
+    )
+
+    file_key = None
+    try:
+        file_stat = file_path.stat()
+        file_key = (file_stat.st_mtime_ns, file_stat.st_size)
+        with open(cache_path, "rb") as f:
+            cached_key, config_data = pickle.load(f)
+        if cached_key == file_key:
+            return config_data
+    except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError) as e:
+        logger.debug(f"Could not use cached configuration file {file_path}: {e}")
+
+    with open(file_path) as f:
+        config_data = yaml.load(f, Loader=YamlLoader)
+
+    if file_key is None:
+        return config_data
+
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        # Write to a private file and swap it in, so that concurrent launches never
+        # read a partially written cache.
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            pickle.dump((file_key, config_data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        logger.debug(f"Could not cache configuration file {file_path}: {e}")
+
+    return config_data
+
+
 def load_configs(manager, **kwargs):
     """Load configuration files.
 
@@ -147,13 +210,12 @@ def load_configs(manager, **kwargs):
     for config_name, file_path in kwargs.items():
         file_path = Path(file_path)
         assert file_path.exists(), "Configuration File not found: {}".format(file_path)
-        with open(file_path) as f:
-            try:
-                config_data = yaml.load(f, Loader=yaml.FullLoader)
-                build_nested_dict(manager, config_dict, config_name, config_data)
-            except yaml.YAMLError as yaml_error:
-                print(f"Configuration - Yaml Error: {yaml_error}")
-                sys.exit(1)
+        try:
+            config_data = load_yaml_config(file_path)
+            build_nested_dict(manager, config_dict, config_name, config_data)
+        except yaml.YAMLError as yaml_error:
+            print(f"Configuration - Yaml Error: {yaml_error}")
+            sys.exit(1)
 
     # return combined dictionary
     return config_dict
@@ -172,19 +234,25 @@ def build_nested_dict(manager, parent_dict, key_name, dict_data):
         Name of dictionary to insert
     dict_data : dict
         Dictionary to insert
+
+    Notes
+    -----
+    Children are collected in a local dict/list and handed to the manager when
+    the shared container is created, so each nested dict or list costs a
+    single round trip to the manager instead of one per key.
     """
-    if type(dict_data) != dict and type(dict_data) != list:
-        parent_dict[key_name] = dict_data
-        return
     if type(dict_data) == dict:
-        d = manager.dict()
+        values = {}
         for k in dict_data:
-            build_nested_dict(manager, d, k, dict_data[k])
-    else:
-        d = manager.list()
+            build_nested_dict(manager, values, k, dict_data[k])
+        d = manager.dict(values)
+    elif type(dict_data) == list:
+        values = [None] * len(dict_data)
         for i, v in enumerate(dict_data):
-            d.append(None)
-            build_nested_dict(manager, d, i, v)
+            build_nested_dict(manager, values, i, v)
+        d = manager.list(values)
+    else:
+        d = dict_data
     parent_dict[key_name] = d
 
 
@@ -219,7 +287,7 @@ def update_config_dict(
             file_path.endswith(".yml") or file_path.endswith(".yaml")
         ):
             with open(file_path) as f:
-                new_config = yaml.load(f, Loader=yaml.FullLoader)
+                new_config = yaml.load(f, Loader=YamlLoader)
         else:
             return False
 
@@ -66,14 +66,15 @@ class Configurator:
         ----------
         root : tk.Tk
             The main window of the application
-        splash_screen : SplashScreen
-            The splash screen of the application
+        splash_screen : SplashScreen or None
+            The splash screen of the application, if one is shown
         """
         self.root = root
 
         # Show the splash screen for 1 second and then destroy it.
-        sleep(1)
-        splash_screen.destroy()
+        if splash_screen is not None:
+            sleep(1)
+            splash_screen.destroy()
         self.root.deiconify()
         self.view = ConfigurationAssistantWindow(root)
         self.view.microscope_window = MicroscopeWindow(
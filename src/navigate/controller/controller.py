@@ -122,8 +122,8 @@ class Controller:
         ----------
         root : Tk top-level widget.
             Tk.tk GUI instance.
-        splash_screen : Tk top-level widget.
-            Tk.tk GUI instance.
+        splash_screen : Tk top-level widget or None.
+            Tk.tk GUI instance, or None when started without a splash screen.
         configuration_path : string
             Path to the configuration yaml file.
             Provides global microscope configuration parameters.
@@ -337,7 +337,8 @@ class Controller:
         self.initialize_cam_view()
 
         # destroy splash screen and show main screen
-        self.splash_screen.destroy()
+        if self.splash_screen is not None:
+            self.splash_screen.destroy()
         self.root.deiconify()
 
         #: int: ID for the resize event.Only works on Windows OS.
@@ -1096,8 +1097,46 @@ class Controller:
 
         self.stop_acquisition_flag = False
         start_time = time.time()
+        # The model sends every frame id, but the histogram, progress bar and
+        # framerate only need to keep pace with the screen refresh.
+        refresh_interval = 1 / 30
+        last_refresh = 0.0
+        # Latest frame shown but left out of the last refresh, if any.
+        skipped_image_id = None
         self.camera_setting_controller.update_readout_time()
 
+        def refresh_statistics(image_id, stop_time):
+            self.histogram_controller.populate_histogram(
+                image=self.data_buffer[image_id]
+            )
+
+            # Update progress bar.
+            self.acquire_bar_controller.progress_bar(
+                images_received=images_received,
+                microscope_state=self.configuration["experiment"]["MicroscopeState"],
+                mode=mode,
+                stop=False,
+            )
+            # update framerate
+            try:
+                frames_per_second = images_received / (stop_time - start_time)
+            except ZeroDivisionError:
+                frames_per_second = 1 / (
+                    self.configuration["experiment"]["MicroscopeState"]["channels"][
+                        "channel_1"
+                    ].get("camera_exposure_time", 200)
+                    / 1000
+                )
+
+            # Update the Framerate in the Camera Settings Tab
+            self.camera_setting_controller.framerate_widgets["max_framerate"].set(
+                frames_per_second
+            )
+
+            # Update the Framerate in the Acquire Bar to provide an estimate of
+            # the duration of time remaining.
+            self.acquire_bar_controller.framerate = frames_per_second
+
         while True:
             if self.stop_acquisition_flag:
                 break
@@ -1125,38 +1164,20 @@ class Controller:
             self.mip_setting_controller.try_to_display_image(
                 image=self.data_buffer[image_id]
             )
-            self.histogram_controller.populate_histogram(
-                image=self.data_buffer[image_id]
-            )
             images_received += 1
 
-            # Update progress bar.
-            self.acquire_bar_controller.progress_bar(
-                images_received=images_received,
-                microscope_state=self.configuration["experiment"]["MicroscopeState"],
-                mode=mode,
-                stop=False,
-            )
-            # update framerate
             stop_time = time.time()
-            try:
-                frames_per_second = images_received / (stop_time - start_time)
-            except ZeroDivisionError:
-                frames_per_second = 1 / (
-                    self.configuration["experiment"]["MicroscopeState"]["channels"][
-                        "channel_1"
-                    ].get("camera_exposure_time", 200)
-                    / 1000
-                )
+            if stop_time - last_refresh < refresh_interval:
+                skipped_image_id = image_id
+                continue
+            last_refresh = stop_time
+            skipped_image_id = None
 
-            # Update the Framerate in the Camera Settings Tab
-            self.camera_setting_controller.framerate_widgets["max_framerate"].set(
-                frames_per_second
-            )
+            refresh_statistics(image_id, stop_time)
 
-            # Update the Framerate in the Acquire Bar to provide an estimate of
-            # the duration of time remaining.
-            self.acquire_bar_controller.framerate = frames_per_second
+        # Catch the histogram and framerate up with the last frame displayed.
+        if skipped_image_id is not None:
+            refresh_statistics(skipped_image_id, time.time())
 
         logger.info(
             f"Navigate Controller - Captured {images_received}, " f"{mode} Images"
@@ -1765,14 +1765,16 @@ class SpooledImageLoader:
             The slice index of the image.
         """
 
-        image = image.flatten()
+        # Write straight from the frame's buffer. flatten() would copy the frame
+        # first; the shared-memory frames are already C-contiguous.
+        image = np.ascontiguousarray(image)
 
         if self.temp_files[channel].tell() == 0:
             self.n_bytes = image.nbytes
 
         start_idx, end_idx = self.get_indices(slice_index)
         self.temp_files[channel].seek(start_idx)
-        self.temp_files[channel].write(image)
+        self.temp_files[channel].write(memoryview(image).cast("B"))
 
     def load_image(self, channel: int, slice_index: int):
         """Load an image from a temporary file.
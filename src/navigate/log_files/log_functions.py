@@ -46,6 +46,7 @@ import yaml
 # Local Imports
 from navigate.config.config import get_navigate_path
 from navigate.tools.common_dict_tools import update_nested_dict
+from navigate.tools.file_functions import YamlLoader
 
 
 def find_filename(k, v):
@@ -137,7 +138,7 @@ def log_setup(logging_configuration, logging_path=None):
     # Read the logging configuration file.
     with open(logging_configuration_path, "r") as f:
         try:
-            config_data = yaml.load(f.read(), Loader=yaml.FullLoader)
+            config_data = yaml.load(f.read(), Loader=YamlLoader)
 
             # Force all log files to be created relative to logging_path
             config_data2 = update_nested_dict(
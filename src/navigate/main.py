@@ -32,14 +32,12 @@
 
 # Standard Library Imports
 import tkinter as tk
-import platform
+import sys
 import os
 
 # Third Party Imports
 
 # Local Imports
-from navigate.controller.controller import Controller
-from navigate.controller.configurator import Configurator
 from navigate.log_files.log_functions import log_setup
 from navigate.view.splash_screen import SplashScreen
 from navigate.tools.main_functions import (
@@ -70,8 +68,9 @@ def main():
         --waveform-templates-file
         --logging-confi
         --configurator
+        --no-splash
     """
-    if platform.system() != "Windows":
+    if sys.platform != "win32":
         print(
             "WARNING: navigate was built to operate on a Windows platform. "
             "While much of the software will work for evaluation purposes, some "
@@ -84,16 +83,20 @@ def main():
     root = tk.Tk()
     root.withdraw()
 
-    # Splash Screen
-    current_directory = os.path.dirname(os.path.realpath(__file__))
-    splash_screen = SplashScreen(
-        root, os.path.join(current_directory, "view", "icon", "splash_screen_image.png")
-    )
-
     # Parse command line arguments
     parser = create_parser()
     args = parser.parse_args()
 
+    # Splash Screen
+    if args.no_splash:
+        splash_screen = None
+    else:
+        current_directory = os.path.dirname(os.path.realpath(__file__))
+        splash_screen = SplashScreen(
+            root,
+            os.path.join(current_directory, "view", "icon", "splash_screen_image.png"),
+        )
+
     (
         configuration_path,
         experiment_path,
@@ -108,9 +111,14 @@ def main():
 
     log_setup("logging.yml", logging_path)
 
+    # Import only the branch in use, now that the splash screen is up.
     if args.configurator:
+        from navigate.controller.configurator import Configurator
+
         Configurator(root, splash_screen)
     else:
+        from navigate.controller.controller import Controller
+
         Controller(
             root,
             splash_screen,
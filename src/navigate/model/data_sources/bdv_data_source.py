@@ -105,7 +105,7 @@ class BigDataViewerDataSource(PyramidalDataSource):
 
         super().__init__(file_name=file_name, mode=mode)
 
-    def get_slice(self, x, y, c, z=0, t=0, p=0, subdiv=0) -> npt.ArrayLike:
+    def get_slice(self, x, y, c, z=0, t=0, p=0, subdiv=0, out=None) -> npt.ArrayLike:
         """Get a 3D slice of the dataset for a single c, t, p, subdiv.
 
         Parameters
@@ -124,14 +124,22 @@ class BigDataViewerDataSource(PyramidalDataSource):
             Single position
         subdiv : int
             Subdivision of the dataset to index along
+        out : npt.NDArray, optional
+            C-contiguous array to read the slice into instead of allocating one.
 
         Returns
         -------
         npt.ArrayLike
-            3D (z, y, x) slice of data set
+            3D (z, y, x) slice of data set, or out if given
         """
         setup = self.ds_name(t, c, p).replace("???", str(subdiv))
-        return self.image[setup][z, y, x]
+        if out is None:
+            return self.image[setup][z, y, x]
+        if self.__file_type == "h5":
+            self.image[setup].read_direct(out, (z, y, x))
+        else:
+            self.image[setup].get_basic_selection((z, y, x), out=out)
+        return out
 
     def set_metadata_from_configuration_experiment(
         self, configuration: Dict[str, Any], microscope_name: str = None
@@ -171,9 +179,7 @@ class BigDataViewerDataSource(PyramidalDataSource):
 
         ds_name = self.ds_name(t, c, pos)
         is_kw = len(kw) > 0
-        for i in range(self.subdivisions.shape[0]):
-            dx, dy, dz = self.resolutions[i, ...]
-
+        for i, (dx, dy, dz) in enumerate(self._resolution_tuples):
             # Down-sample in Z.
             if z % dz == 0:
                 dataset_name = ds_name.replace("???", str(i))
@@ -182,7 +188,11 @@ class BigDataViewerDataSource(PyramidalDataSource):
                 zs = min(z // dz, self.shapes[i, 0] - 1)  # TODO: Is this necessary?
 
                 # Down-sample in X and Y.
-                self.image[dataset_name][zs, ...] = data[::dy, ::dx].astype(self.dtype)
+                # Hand the shared buffer view straight to h5py unless the dtype
+                # actually has to change.
+                self.image[dataset_name][zs, ...] = data[::dy, ::dx].astype(
+                    self.dtype, copy=False
+                )
                 if is_kw and (i == 0):
                     self._views.append(kw)
         self._current_frame += 1
@@ -270,6 +280,8 @@ class BigDataViewerDataSource(PyramidalDataSource):
         setup_start, setup_end = 0, self.shape_c * self.positions
         if len(args) >= 2:
             setup_start, setup_end = args[0], args[1]
+        if self._shapes is None:
+            self._compute_pyramid_geometry()
 
         # Create setups
         for i in range(setup_start, setup_end):
@@ -298,23 +310,22 @@ class BigDataViewerDataSource(PyramidalDataSource):
             time_group_name = f"t{t:05}"
             for i in range(setup_start, setup_end):
                 setup_group_name = f"s{i:02}"
-                for j in range(self.subdivisions.shape[0]):
+                for j, (dx, dy, dz) in enumerate(self._resolution_tuples):
                     dataset_name = "/".join(
                         [time_group_name, setup_group_name, f"{j}", "cells"]
                     )
                     if dataset_name in self.image:
                         del self.image[dataset_name]
-                    # print(f"Creating {dataset_name} with shape {self.shapes[j,...]}")
                     dataset = self.image.create_dataset(
                         dataset_name,
-                        chunks=tuple(self.subdivisions[j, ...][::-1]),
-                        shape=self.shapes[j, ...],
+                        chunks=self._chunk_tuples[j],
+                        shape=self._shape_tuples[j],
                         dtype=self.dtype,
                     )
                     dataset.attrs["element_size_um"] = [
-                        self.dy * self.resolutions[j, ...][1],
-                        self.dx * self.resolutions[j, ...][0],
-                        self.dz * self.resolutions[j, ...][2],
+                        self.dy * dy,
+                        self.dx * dx,
+                        self.dz * dz,
                     ]
 
     def _setup_n5(self, *args, create_flag=True):
@@ -344,6 +355,8 @@ class BigDataViewerDataSource(PyramidalDataSource):
         setup_start, setup_end = 0, self.shape_c * self.positions
         if len(args) >= 2:
             setup_start, setup_end = args[0], args[1]
+        if self._shapes is None:
+            self._compute_pyramid_geometry()
 
         for i in range(setup_start, setup_end):
             setup_group_name = f"setup{i}"
@@ -353,9 +366,9 @@ class BigDataViewerDataSource(PyramidalDataSource):
             for t in range(self.shape_t):
                 time_group_name = f"timepoint{t}"
                 timepoint = setup.create_group(time_group_name)
-                for j in range(self.subdivisions.shape[0]):
+                for j, zyx_shape in enumerate(self._shape_tuples):
                     s_group_name = f"s{j}"
-                    shape = [int(x) for x in self.shapes[j, ...][::-1]]
+                    shape = zyx_shape[::-1]
                     # chunks = self.subdivisions[j, ...]
                     sx = timepoint.zeros(
                         s_group_name, shape=tuple(shape), chunks=(shape[0], shape[1], 1)
@@ -32,6 +32,8 @@
 
 # Standard library imports
 import logging
+import math
+from itertools import product
 from typing import Any, Dict
 
 # Third-party imports
@@ -40,7 +42,7 @@ import numpy.typing as npt
 
 # Local application imports
 from .data_source import DataSource
-from ...tools.slicing import ensure_slice, ensure_iter, slice_len
+from ...tools.slicing import normalize_keys, slice_len
 
 # Logger Setup
 p = __name__.split(".")[1]
@@ -66,12 +68,20 @@ class PyramidalDataSource(DataSource):
         """
         #: np.array: The resolution of each down-sampled pyramid level.
         self._resolutions = np.array([[1, 1, 1]], dtype=int)
+        #: tuple: The resolutions as plain (x, y, z) int tuples for hot loops.
+        self._resolution_tuples = ((1, 1, 1),)
         #: np.array: The number of subdivisions in each dimension.
         self._subdivisions = None
 
         #: np.array: The shape of the image.
         self._shapes = None
 
+        #: tuple: The shape of each pyramid level as plain (z, y, x) int tuples.
+        self._shape_tuples = None
+
+        #: tuple: The chunk size of each pyramid level as (z, y, x) int tuples.
+        self._chunk_tuples = None
+
         super().__init__(file_name, mode)
 
     @property
@@ -99,16 +109,7 @@ class PyramidalDataSource(DataSource):
             The subdivisions.
         """
         if self._subdivisions is None:
-            self._subdivisions = np.zeros((self.resolutions.shape[0], 3), dtype=int)
-            self._subdivisions[:, 0] = np.gcd(32, self.shapes[:, 0])
-            self._subdivisions[:, 1] = np.gcd(32, self.shapes[:, 1])
-            self._subdivisions[:, 2] = np.gcd(32, self.shapes[:, 2])
-
-            # Safety
-            self._subdivisions = np.maximum(self._subdivisions, 1)
-
-            # Reverse to XYZ
-            self._subdivisions = self._subdivisions[:, ::-1]
+            self._compute_pyramid_geometry()
         return self._subdivisions
 
     @property
@@ -123,15 +124,30 @@ class PyramidalDataSource(DataSource):
             The shapes.
         """
         if self._shapes is None:
-            self._shapes = np.maximum(
-                np.ceil(
-                    np.array([self.shape_z, self.shape_y, self.shape_x])[None, :]
-                    / self.resolutions[:, ::-1]
-                ).astype(int),
-                1,
-            )
+            self._compute_pyramid_geometry()
         return self._shapes
 
+    def _compute_pyramid_geometry(self) -> None:
+        """Compute the shape and subdivisions of every pyramid level in one pass.
+
+        There are only a handful of levels, so plain integer math is cheaper than
+        a chain of small NumPy operations.
+        """
+        shapes, subdivisions = [], []
+        for dx, dy, dz in self._resolution_tuples:
+            shape = (
+                max(-(-self.shape_z // dz), 1),
+                max(-(-self.shape_y // dy), 1),
+                max(-(-self.shape_x // dx), 1),
+            )
+            shapes.append(shape)
+            # Reverse to XYZ
+            subdivisions.append(tuple(math.gcd(32, n) for n in shape[::-1]))
+        self._shape_tuples = tuple(shapes)
+        self._chunk_tuples = tuple(sub[::-1] for sub in subdivisions)
+        self._shapes = np.array(shapes, dtype=int)
+        self._subdivisions = np.array(subdivisions, dtype=int)
+
     @property
     def nbytes(self) -> int:
         """Getter for image size.
@@ -143,14 +159,10 @@ class PyramidalDataSource(DataSource):
         size : int
             The size of the image in bytes.
         """
-        return (
-            np.prod(self.shapes, axis=1)
-            * self.shape_t
-            * self.shape_c
-            * self.positions
-            * self.bits
-            // 8
-        ).sum()
+        if self._shapes is None:
+            self._compute_pyramid_geometry()
+        bits = self.shape_t * self.shape_c * self.positions * self.bits
+        return sum(z * y * x * bits // 8 for z, y, x in self._shape_tuples)
 
     def set_metadata_from_configuration_experiment(
         self, configuration: Dict[str, Any], microscope_name: str = None
@@ -166,6 +178,8 @@ class PyramidalDataSource(DataSource):
         """
         self._subdivisions = None
         self._shapes = None
+        self._shape_tuples = None
+        self._chunk_tuples = None
 
         if ("BDVParameters" in configuration["experiment"].keys()
             and "down_sample" in configuration["experiment"]["BDVParameters"].keys()):
@@ -181,17 +195,19 @@ class PyramidalDataSource(DataSource):
                     "axial_down_sample", 1
                 )
 
-                xy_values = [2**i for i in range(int(np.log2(max_xy)) + 1)]
-                z_values = [2**i for i in range(int(np.log2(max_z)) + 1)]
-
-                max_len = max(len(xy_values), len(z_values))
-                xy_values.extend([xy_values[-1]] * (max_len - len(xy_values)))
-                z_values.extend([z_values[-1]] * (max_len - len(z_values)))
+                # Levels down-sample by successive powers of 2 until each axis
+                # reaches its maximum, then hold there.
+                xy_bits = int(math.log2(max_xy)) + 1
+                z_bits = int(math.log2(max_z)) + 1
+                levels = np.arange(max(xy_bits, z_bits))
+                xy_values = np.left_shift(1, np.minimum(levels, xy_bits - 1))
+                z_values = np.left_shift(1, np.minimum(levels, z_bits - 1))
 
                 #: npt.NDArray: The resolution of each down-sampled pyramid level.
-                self._resolutions = np.array(
-                    [[xy, xy, z] for xy, z in zip(xy_values, z_values)], dtype=int
-                )
+                self._resolutions = np.column_stack(
+                    [xy_values, xy_values, z_values]
+                ).astype(int)
+                self._resolution_tuples = tuple(map(tuple, self._resolutions.tolist()))
 
         return super().set_metadata_from_configuration_experiment(
             configuration, microscope_name
@@ -237,47 +253,68 @@ class PyramidalDataSource(DataSource):
             raise IndexError(error_statement)
 
         # Get indices as slices/ranges
-        xs = ensure_slice(keys, 0)
-        ys = ensure_slice(keys, 1)
-        cs = ensure_iter(keys, 2, self.shape[2])
-        zs = ensure_slice(keys, 3)
-        ts = ensure_iter(keys, 4, self.shape[4])
-        ps = ensure_iter(keys, 5, self.positions)
-
-        if length > 1 and keys[-1] == Ellipsis:
-            keys = keys[:-1]
-            length -= 1
-
-        if length > 6 and isinstance(keys[6], int):
-            sub_divisions = keys[6]
-        else:
-            sub_divisions = 0
+        xs, ys, cs, zs, ts, ps, sub_divisions = normalize_keys(
+            keys, (*self.shape, self.positions)
+        )
 
         if len(cs) == 1 and len(ts) == 1 and len(ps) == 1:
             return self.get_slice(xs, ys, cs[0], zs, ts[0], ps[0], sub_divisions)
 
+        return self.get_slice_batch(xs, ys, cs, zs, ts, ps, sub_divisions)
+
+    def get_slice_batch(self, x, y, cs, z, ts, ps, subdiv=0) -> npt.ArrayLike:
+        """Get a 6D slice of the dataset over several channels, timepoints and
+        positions.
+
+        Reads one 3D slice per (c, t, p) through get_slice(). Derived classes
+        whose storage can read several channels, timepoints or positions at once
+        should override this.
+
+        Parameters
+        ----------
+        x : slice
+            x indices to grab
+        y : slice
+            y indices to grab
+        cs : range
+            Channels to grab
+        z : slice
+            z indices to grab
+        ts : range
+            Timepoints to grab
+        ps : range
+            Positions to grab
+        subdiv : int
+            Subdivision of the dataset to index along
+
+        Returns
+        -------
+        npt.ArrayLike
+            Array of shape (p, t, z, c, y, x)
+        """
+        dx, dy, dz = self._resolution_tuples[subdiv]
+        # Fill (c, t, p)-major so every tile lands in one contiguous block.
         sliced_ds = np.empty(
             (
-                len(ps),
-                len(ts),
-                slice_len(zs, self.shape_z) // self.resolutions[sub_divisions][2],
                 len(cs),
-                slice_len(ys, self.shape_y) // self.resolutions[sub_divisions][1],
-                slice_len(xs, self.shape_x) // self.resolutions[sub_divisions][0],
+                len(ts),
+                len(ps),
+                slice_len(z, self.shape_z) // dz,
+                slice_len(y, self.shape_y) // dy,
+                slice_len(x, self.shape_x) // dx,
             ),
             dtype=self.dtype,
         )
 
-        for c in cs:
-            for t in ts:
-                for p in ps:
-                    sliced_ds[p, t, :, c, :, :] = self.get_slice(
-                        xs, ys, c, zs, t, p, sub_divisions
-                    )
+        for (ci, c), (ti, t), (pi, p) in product(
+            enumerate(cs), enumerate(ts), enumerate(ps)
+        ):
+            self.get_slice(x, y, c, z, t, p, subdiv, out=sliced_ds[ci, ti, pi])
 
-        return sliced_ds
+        # (c, t, p, z, y, x) -> (p, t, z, c, y, x)
+        return sliced_ds.transpose(2, 1, 3, 0, 4, 5)
 
-    def get_slice(self, x, y, c, z=0, t=0, p=0, subdiv=0) -> npt.ArrayLike:
+    def get_slice(self, x, y, c, z=0, t=0, p=0, subdiv=0, out=None) -> npt.ArrayLike:
         """Get a 3D slice of the dataset for a single c, t, p, subdiv.
 
         Parameters
@@ -296,11 +333,13 @@ class PyramidalDataSource(DataSource):
             Single position
         subdiv : int
             Subdivision of the dataset to index along
+        out : npt.NDArray, optional
+            C-contiguous array to read the slice into instead of allocating one.
 
         Returns
         -------
         npt.ArrayLike
-            3D (z, y, x) slice of data set
+            3D (z, y, x) slice of data set, or out if given
 
         Raises
         ------
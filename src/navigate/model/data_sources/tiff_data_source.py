@@ -226,7 +226,7 @@ class TiffDataSource(DataSource):
         data : npt.ArrayLike
             Data to write to file.
         kw : dict
-            Keyword arguments to pass to tifffile.imsave.
+            Keyword arguments to pass to tifffile.imwrite.
         """
         self.mode = "w"
 
@@ -249,6 +249,10 @@ class TiffDataSource(DataSource):
 
         if self.is_ome:
             self.image[c].write(data, description=ome_xml, contiguous=True)
+        elif z > 0:
+            # Later planes extend the contiguous series opened by the first plane,
+            # whose tags already carry the stack metadata.
+            self.image[c].write(data, contiguous=True)
         else:
             dx, dy, dz = self.metadata.voxel_size
             md = {
@@ -35,6 +35,7 @@ from typing import Optional, Dict, Any
 
 # Third-party imports
 import zarr
+import numpy as np
 import numpy.typing as npt
 import zarr.storage
 
@@ -69,7 +70,7 @@ class OMEZarrDataSource(PyramidalDataSource):
 
         super().__init__(file_name=file_name, mode=mode)
 
-    def get_slice(self, x, y, c, z=0, t=0, p=0, subdiv=0) -> npt.ArrayLike:
+    def get_slice(self, x, y, c, z=0, t=0, p=0, subdiv=0, out=None) -> npt.ArrayLike:
         """Get a 3D slice of the dataset for a single c, t, p, subdiv.
 
         Parameters
@@ -88,14 +89,61 @@ class OMEZarrDataSource(PyramidalDataSource):
             Single position
         subdiv : int
             Subdivision of the dataset to index along
+        out : npt.NDArray, optional
+            C-contiguous array to read the slice into instead of allocating one.
 
         Returns
         -------
         npt.ArrayLike
-            3D (z, y, x) slice of data set
+            3D (z, y, x) slice of data set, or out if given
         """
         dataset_name = f"{GROUP_PREFIX}{p}_{subdiv}"
-        return self.image[dataset_name][t, c, z, y, x]
+        if out is None:
+            return self.image[dataset_name][t, c, z, y, x]
+        self.image[dataset_name].get_basic_selection((t, c, z, y, x), out=out)
+        return out
+
+    def get_slice_batch(self, x, y, cs, z, ts, ps, subdiv=0) -> npt.ArrayLike:
+        """Get a 6D slice of the dataset over several channels, timepoints and
+        positions.
+
+        Each position is stored as one (t, c, z, y, x) array, so all requested
+        channels and timepoints of a position are read in a single orthogonal
+        selection.
+
+        Parameters
+        ----------
+        x : slice
+            x indices to grab
+        y : slice
+            y indices to grab
+        cs : range
+            Channels to grab
+        z : slice
+            z indices to grab
+        ts : range
+            Timepoints to grab
+        ps : range
+            Positions to grab
+        subdiv : int
+            Subdivision of the dataset to index along
+
+        Returns
+        -------
+        npt.ArrayLike
+            Array of shape (p, t, z, c, y, x)
+        """
+        selection = (np.asarray(ts), np.asarray(cs), z, y, x)
+        sliced_ds = np.stack(
+            [
+                self.image[f"{GROUP_PREFIX}{p}_{subdiv}"].get_orthogonal_selection(
+                    selection
+                )
+                for p in ps
+            ]
+        )
+        # (p, t, c, z, y, x) -> (p, t, z, c, y, x)
+        return sliced_ds.transpose(0, 1, 3, 2, 4, 5)
 
     def setup(self):
         """Set up the Zarr writer."""
@@ -167,12 +215,11 @@ class OMEZarrDataSource(PyramidalDataSource):
                 self.new_position(p)
 
         # TODO: Make sure this also functions.
-        for ri, res in enumerate(self.resolutions):
-            dx, dy, dz = res
+        for ri, (dx, dy, dz) in enumerate(self._resolution_tuples):
             dataset_name = f"{GROUP_PREFIX}{p}_{ri}"
             zs = min(z // dz, self.shapes[ri, 0] - 1)
             self.image[dataset_name][t, c, zs, ...] = data[::dy, ::dx].astype(
-                self.dtype
+                self.dtype, copy=False
             )
 
         self._current_frame += 1
@@ -1509,82 +1509,195 @@ def load_devices(
     if plugin_devices is None:
         plugin_devices = {}
 
+    hardware = configuration["configuration"]["hardware"].keys()
+    device_args = (configuration, is_synthetic, plugin_devices)
+
+    # hardware entry: (key in the devices dictionary, loader, loader arguments)
+    loaders = {
+        "camera": ("camera", load_cameras, device_args),
+        "mirror": ("mirror", load_mirrors, device_args),
+        "zoom": ("zoom", load_zooms, device_args),
+        "daq": ("daq", start_daq, (configuration, is_synthetic)),
+        "filter_wheel": ("filter_wheel", load_filter_wheels, device_args),
+        "stage": ("stages", load_stages_by_name, device_args),
+    }
+
+    # Connect one device type at a time on the calling thread. Vendor SDKs
+    # (camera, DAQ, stage and plugin devices) are not necessarily thread-safe, and
+    # some expect later calls to come from the thread that opened them.
     devices = {}
-    # load camera
-    if "camera" in configuration["configuration"]["hardware"].keys():
-        devices["camera"] = {}
-        for id, device in enumerate(
-            configuration["configuration"]["hardware"]["camera"]
-        ):
-            try:
-                camera = load_camera_connection(configuration, id, is_synthetic)
-            except RuntimeError as e:  # noqa
-                if "camera" in plugin_devices:
-                    camera = plugin_devices["camera"]["load_device"](
-                        configuration, id, is_synthetic
-                    )
-                else:
-                    error_statement = f"Error loading camera: {e}"
-                    logger.error(error_statement)
-                    raise Exception(error_statement)
-
-            if (not is_synthetic) and device["type"].startswith("Hamamatsu"):
-                camera_serial_number = str(camera._serial_number)
-                device_ref_name = camera_serial_number
-                # if the serial number has leading zeros,
-                # the yaml reader will convert it to an octal number
-                if camera_serial_number.startswith("0"):
-                    try:
-                        oct_num = int(camera_serial_number, 8)
-                        device_ref_name = str(oct_num)
-                    except ValueError:
-                        logger.debug("Error converting camera serial number to octal")
-                        pass
+    for device_type, (device_key, loader, args) in loaders.items():
+        if device_type in hardware:
+            devices[device_key] = loader(*args)
+
+    return devices
+
+
+def load_cameras(
+    configuration: Dict[str, Any], is_synthetic=False, plugin_devices=None
+) -> dict:
+    """Load all cameras from configuration.
+
+    Parameters
+    ----------
+    configuration : Dict[str, Any]
+        Configuration dictionary
+    is_synthetic : bool
+        Run synthetic version of hardware?
+    plugin_devices : dict
+        Dictionary of plugin devices
+
+    Returns
+    -------
+    cameras : dict
+        Dictionary of camera connections keyed by device reference name
+    """
+    if plugin_devices is None:
+        plugin_devices = {}
+
+    cameras = {}
+    for id, device in enumerate(configuration["configuration"]["hardware"]["camera"]):
+        try:
+            camera = load_camera_connection(configuration, id, is_synthetic)
+        except RuntimeError as e:  # noqa
+            if "camera" in plugin_devices:
+                camera = plugin_devices["camera"]["load_device"](
+                    configuration, id, is_synthetic
+                )
             else:
-                device_ref_name = str(device["serial_number"])
-            devices["camera"][device_ref_name] = camera
-
-    # load mirror
-    if "mirror" in configuration["configuration"]["hardware"].keys():
-        devices["mirror"] = {}
-        device = configuration["configuration"]["hardware"]["mirror"]
-        device_ref_name = build_ref_name("_", device["type"])
-        devices["mirror"][device_ref_name] = load_mirror(configuration, is_synthetic)
-
-    # load zoom
-    if "zoom" in configuration["configuration"]["hardware"].keys():
-        devices["zoom"] = {}
-        device = configuration["configuration"]["hardware"]["zoom"]
-        device_ref_name = build_ref_name("_", device["type"], device["servo_id"])
-        devices["zoom"][device_ref_name] = load_zoom_connection(
+                error_statement = f"Error loading camera: {e}"
+                logger.error(error_statement)
+                raise Exception(error_statement)
+
+        if (not is_synthetic) and device["type"].startswith("Hamamatsu"):
+            camera_serial_number = str(camera._serial_number)
+            device_ref_name = camera_serial_number
+            # if the serial number has leading zeros,
+            # the yaml reader will convert it to an octal number
+            if camera_serial_number.startswith("0"):
+                try:
+                    oct_num = int(camera_serial_number, 8)
+                    device_ref_name = str(oct_num)
+                except ValueError:
+                    logger.debug("Error converting camera serial number to octal")
+                    pass
+        else:
+            device_ref_name = str(device["serial_number"])
+        cameras[device_ref_name] = camera
+
+    return cameras
+
+
+def load_mirrors(
+    configuration: Dict[str, Any], is_synthetic=False, plugin_devices=None
+) -> dict:
+    """Load the mirror from configuration.
+
+    Parameters
+    ----------
+    configuration : Dict[str, Any]
+        Configuration dictionary
+    is_synthetic : bool
+        Run synthetic version of hardware?
+    plugin_devices : dict
+        Dictionary of plugin devices
+
+    Returns
+    -------
+    mirrors : dict
+        Dictionary of mirror connections keyed by device reference name
+    """
+    device = configuration["configuration"]["hardware"]["mirror"]
+    device_ref_name = build_ref_name("_", device["type"])
+    return {device_ref_name: load_mirror(configuration, is_synthetic)}
+
+
+def load_zooms(
+    configuration: Dict[str, Any], is_synthetic=False, plugin_devices=None
+) -> dict:
+    """Load the zoom from configuration.
+
+    Parameters
+    ----------
+    configuration : Dict[str, Any]
+        Configuration dictionary
+    is_synthetic : bool
+        Run synthetic version of hardware?
+    plugin_devices : dict
+        Dictionary of plugin devices
+
+    Returns
+    -------
+    zooms : dict
+        Dictionary of zoom connections keyed by device reference name
+    """
+    device = configuration["configuration"]["hardware"]["zoom"]
+    device_ref_name = build_ref_name("_", device["type"], device["servo_id"])
+    return {
+        device_ref_name: load_zoom_connection(
             configuration, is_synthetic, plugin_devices
         )
+    }
 
-    # load daq
-    if "daq" in configuration["configuration"]["hardware"].keys():
-        devices["daq"] = start_daq(configuration, is_synthetic)
-
-    # load filter wheels
-    if "filter_wheel" in configuration["configuration"]["hardware"].keys():
-        devices["filter_wheel"] = {}
-        filter_wheels = configuration["configuration"]["hardware"]["filter_wheel"]
-        for i, filter_wheel_config in enumerate(filter_wheels):
-            device_ref_name = build_ref_name(
-                "_", filter_wheel_config["type"], filter_wheel_config["wheel_number"]
-            )
-            devices["filter_wheel"][device_ref_name] = load_filter_wheel_connection(
-                filter_wheel_config, is_synthetic, plugin_devices
-            )
 
-    # load stage
-    if "stage" in configuration["configuration"]["hardware"].keys():
-        device_config = configuration["configuration"]["hardware"]["stage"]
-        devices["stages"] = {}
-        stages = load_stages(configuration, is_synthetic, plugin_devices)
-        for i, stage in enumerate(stages):
-            device_ref_name = build_ref_name(
-                "_", device_config[i]["type"], device_config[i]["serial_number"]
-            )
-            devices["stages"][device_ref_name] = stage
+def load_filter_wheels(
+    configuration: Dict[str, Any], is_synthetic=False, plugin_devices=None
+) -> dict:
+    """Load all filter wheels from configuration.
 
-    return devices
+    Parameters
+    ----------
+    configuration : Dict[str, Any]
+        Configuration dictionary
+    is_synthetic : bool
+        Run synthetic version of hardware?
+    plugin_devices : dict
+        Dictionary of plugin devices
+
+    Returns
+    -------
+    filter_wheels : dict
+        Dictionary of filter wheel connections keyed by device reference name
+    """
+    filter_wheels = {}
+    for filter_wheel_config in configuration["configuration"]["hardware"][
+        "filter_wheel"
+    ]:
+        device_ref_name = build_ref_name(
+            "_", filter_wheel_config["type"], filter_wheel_config["wheel_number"]
+        )
+        filter_wheels[device_ref_name] = load_filter_wheel_connection(
+            filter_wheel_config, is_synthetic, plugin_devices
+        )
+
+    return filter_wheels
+
+
+def load_stages_by_name(
+    configuration: Dict[str, Any], is_synthetic=False, plugin_devices=None
+) -> dict:
+    """Load all stages from configuration.
+
+    Parameters
+    ----------
+    configuration : Dict[str, Any]
+        Configuration dictionary
+    is_synthetic : bool
+        Run synthetic version of hardware?
+    plugin_devices : dict
+        Dictionary of plugin devices
+
+    Returns
+    -------
+    stages : dict
+        Dictionary of stage connections keyed by device reference name
+    """
+    device_config = configuration["configuration"]["hardware"]["stage"]
+    stages = {}
+    for i, stage in enumerate(load_stages(configuration, is_synthetic, plugin_devices)):
+        device_ref_name = build_ref_name(
+            "_", device_config[i]["type"], device_config[i]["serial_number"]
+        )
+        stages[device_ref_name] = stage
+
+    return stages
@@ -34,6 +34,7 @@
 import logging
 import time
 import ctypes
+import threading
 from typing import Optional, Any, Dict, List
 
 # Third Party Imports
@@ -142,6 +143,9 @@ class SyntheticCamera(CameraBase):
         #: int: previous image id
         self.pre_frame_idx = None
 
+        #: threading.Condition: Notified whenever a new frame lands in the buffer.
+        self.frame_ready = threading.Condition()
+
         #: bool: whether to use random image
         self.random_image = True
 
@@ -247,15 +251,16 @@ class SyntheticCamera(CameraBase):
 
     def initialize_image_series(
         self,
-        data_buffer: Optional[List[SharedNDArray]] = None,
+        data_buffer: Optional[SharedNDArray] = None,
         number_of_frames: int = 100,
     ):
         """Initialize SyntheticCamera image series.
 
         Parameters
         ----------
-        data_buffer : Optional[List[SharedNDArray]]
-            The shared data buffer. Default is None.
+        data_buffer : Optional[SharedNDArray]
+            The shared (number_of_frames, height, width) data buffer. Default is
+            None.
         number_of_frames : int
             Number of frames.  Default is 100.
         """
@@ -334,24 +339,26 @@ class SyntheticCamera(CameraBase):
             self.x_pixels * self.y_pixels * 2,
         )
 
-        self.current_frame_idx = (self.current_frame_idx + 1) % self.num_of_frame
+        with self.frame_ready:
+            self.current_frame_idx = (self.current_frame_idx + 1) % self.num_of_frame
+            self.frame_ready.notify_all()
 
     def get_new_frame(self) -> List[int]:
         """Get frame from SyntheticCamera camera."""
 
         time.sleep(self.camera_exposure_time)
-        timeout = 500
-        while self.pre_frame_idx == self.current_frame_idx and timeout:
-            time.sleep(0.001)
-            timeout -= 1
-        if timeout <= 0:
-            return []
-        if self.pre_frame_idx < self.current_frame_idx:
-            frames = list(range(self.pre_frame_idx, self.current_frame_idx))
+        with self.frame_ready:
+            if not self.frame_ready.wait_for(
+                lambda: self.pre_frame_idx != self.current_frame_idx, timeout=0.5
+            ):
+                return []
+            current_frame_idx = self.current_frame_idx
+        if self.pre_frame_idx < current_frame_idx:
+            frames = list(range(self.pre_frame_idx, current_frame_idx))
         else:
             frames = list(range(self.pre_frame_idx, self.num_of_frame))
-            frames += list(range(0, self.current_frame_idx))
-        self.pre_frame_idx = self.current_frame_idx
+            frames += list(range(0, current_frame_idx))
+        self.pre_frame_idx = current_frame_idx
         return frames
 
     def set_ROI(
@@ -67,7 +67,6 @@ class SyntheticRemoteFocus(RemoteFocusBase):
             The device configuration.
         """
         super().__init__(microscope_name, device_connection, configuration)
-        pass
 
     @staticmethod
     def move(readout_time, offset=None):
@@ -82,4 +81,7 @@ class SyntheticRemoteFocus(RemoteFocusBase):
         offset : float
             The offset of the signal in volts.
         """
-        logger.debug(f"Remote focus offset and readout time: {offset}, {readout_time}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Remote focus offset and readout time: %s, %s", offset, readout_time
+            )
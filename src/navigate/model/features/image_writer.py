@@ -41,7 +41,7 @@ from datetime import datetime
 
 # Third Party Imports
 import numpy as np
-from tifffile import imsave
+from tifffile import imwrite
 
 # Local imports
 import navigate
@@ -60,7 +60,7 @@ class ImageWriter:
         self,
         model: "navigate.model.Model",
         microscope_name: str = None,
-        data_buffer: list[SharedNDArray] = None,
+        data_buffer: SharedNDArray = None,
         sub_dir: str = "",
         image_name: Optional[str] = None,
         saving_flags: Optional[list[bool]] = None,
@@ -72,7 +72,7 @@ class ImageWriter:
         ----------
         model : navigate.model.model.Model
             Navigate Model class for controlling hardware/acquisition.
-        data_buffer: [SharedNDArray]
+        data_buffer: SharedNDArray
             data_buffer will use model's default data_buffer if it's not specified
         sub_dir : str
             Sub-directory of self.model.configuration['experiment']
@@ -95,7 +95,7 @@ class ImageWriter:
         # hardware/acquisition.
         self.model = model
 
-        #: [SharedNDArray]: Data buffer for saving data.
+        #: SharedNDArray: Data buffer for saving data.
         self.data_buffer = (
             self.model.data_buffer if data_buffer is None else data_buffer
         )
@@ -147,6 +147,12 @@ class ImageWriter:
             "y": camera_config.get("flip_y", False),
         }
 
+        #: tuple: Index applied to each frame to honor the camera flip flags.
+        self.flip_slices = (
+            slice(None, None, -1 if self.flip_flags["y"] else None),
+            slice(None, None, -1 if self.flip_flags["x"] else None),
+        )
+
         # initialize saving
         self.initialize_saving(sub_dir, image_name)
 
@@ -158,6 +164,8 @@ class ImageWriter:
         frame_ids : list[int]
             Index into self.model.data_buffer.
         """
+        data_source = self.data_source
+        positions = self.model.data_buffer_positions
 
         for idx in frame_ids:
 
@@ -173,40 +181,29 @@ class ImageWriter:
                 self.saving_flags[idx] = False
 
             # Identify channel, z, time, and position indices
-            c_idx, z_idx, t_idx, p_idx = self.data_source._cztp_indices(
-                self.data_source._current_frame, self.data_source.metadata.per_stack
+            c_idx, z_idx, t_idx, p_idx = data_source._cztp_indices(
+                data_source._current_frame, data_source.metadata.per_stack
             )
 
             if c_idx == 0 and z_idx == 0:
                 # Initialize MIP array with same number of channels as the data
-                self.mip = np.ndarray(
+                self.mip = np.zeros(
                     (
-                        int(self.data_source.shape_c),
-                        int(self.data_source.shape_y),
-                        int(self.data_source.shape_x),
-                    )
-                ).astype(np.uint16)
+                        int(data_source.shape_c),
+                        int(data_source.shape_y),
+                        int(data_source.shape_x),
+                    ),
+                    dtype=np.uint16,
+                )
 
             # flip image if necessary
-            if self.flip_flags["x"] and self.flip_flags["y"]:
-                image = self.data_buffer[idx][::-1, ::-1]
-            elif self.flip_flags["x"]:
-                image = self.data_buffer[idx][:, ::-1]
-            elif self.flip_flags["y"]:
-                image = self.data_buffer[idx][::-1, :]
-            else:
-                image = self.data_buffer[idx]
+            image = self.data_buffer[idx][self.flip_slices]
+
             # Save data to disk
             try:
                 start_time = time.time()
-                self.data_source.write(
-                    image,
-                    x=self.model.data_buffer_positions[idx][0],
-                    y=self.model.data_buffer_positions[idx][1],
-                    z=self.model.data_buffer_positions[idx][2],
-                    theta=self.model.data_buffer_positions[idx][3],
-                    f=self.model.data_buffer_positions[idx][4],
-                )
+                x, y, z, theta, f = positions[idx]
+                data_source.write(image, x=x, y=y, z=z, theta=theta, f=f)
                 logger.info(
                     f"C: {c_idx}, Z:{z_idx}, T:{t_idx}, P:{p_idx}, Write Time:"
                     f" {time.time() - start_time}"
@@ -216,10 +213,10 @@ class ImageWriter:
                 self.mip[c_idx, :, :] = np.maximum(self.mip[c_idx, :, :], image)
 
                 # Save the MIP
-                if (c_idx == self.data_source.shape_c - 1) and (
-                    z_idx == self.data_source.shape_z - 1
+                if (c_idx == data_source.shape_c - 1) and (
+                    z_idx == data_source.shape_z - 1
                 ):
-                    for c_save_idx in range(self.data_source.shape_c):
+                    for c_save_idx in range(data_source.shape_c):
                         mip_name = (
                             "P"
                             + str(p_idx).zfill(4)
@@ -230,7 +227,7 @@ class ImageWriter:
                             + str(t_idx).zfill(6)
                             + ".tif"
                         )
-                        imsave(
+                        imwrite(
                             os.path.join(self.mip_directory, mip_name),
                             self.mip[c_save_idx, :, :],
                         )
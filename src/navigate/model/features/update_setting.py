@@ -363,6 +363,8 @@ class UpdateExperimentSetting:
         # update image writer
         if self.model.image_writer:
             try:
+                # queued frames must be saved with the metadata they were taken with
+                self.model.wait_for_writer()
                 self.model.image_writer.data_source.set_metadata_from_configuration_experiment(
                     self.model.configuration
                 )
@@ -560,6 +560,8 @@ class VolumeSearch3D:
         if self.position_id > len(self.model.configuration["multi_positions"]):
             self.position_id = 0
 
+        # frames of the search stack may still be queued for saving
+        self.model.wait_for_writer()
         z_stack_data = self.model.image_writer.data_source.get_data(
             position=self.position_id
         )
@@ -680,6 +682,7 @@ class VolumeSearch3D:
             f" with step_size {self.z_step}"
         )
 
+        self.model.wait_for_writer()
         self.model.image_writer.initialize_saving(sub_dir=str(self.target_resolution))
 
         self.model.logger.info(f"Volume Search 3D completed!")
@@ -34,7 +34,7 @@ import logging
 import importlib  # noqa: F401
 from multiprocessing.managers import ListProxy
 import reprlib
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional
 
 # Third-party imports
 import numpy as np
@@ -133,6 +133,9 @@ class Microscope:
         #: list: List of available channels.
         self.available_channels = None
 
+        #: dict: Maps a channel index to the index and key of the channel after it.
+        self.next_channel = {}
+
         #: int: Number of images.
         self.number_of_frames = None
 
@@ -365,14 +368,14 @@ class Microscope:
             self.daq.add_camera(self.microscope_name, self.camera)
 
     def update_data_buffer(
-        self, data_buffer: List[np.ndarray], number_of_frames: int
+        self, data_buffer: np.ndarray, number_of_frames: int
     ) -> None:
         """Update the data buffer for the camera.
 
         Parameters
         ----------
-        data_buffer : List[np.ndarray]
-            Data buffer for the camera.
+        data_buffer : np.ndarray
+            Data buffer for the camera, indexed by frame id.
         number_of_frames : int
             Number of frames to be acquired.
         """
@@ -458,15 +461,19 @@ class Microscope:
         """Get the available channels for imaging.
 
         This function gets the available channels for imaging by identifying which
-        channels are selected for imaging in the configuration file.
+        channels are selected for imaging in the configuration file. It also builds
+        the channel cycle used by `prepare_next_channel`, where index 0 stands for
+        "no channel yet" and leads to the first selected channel.
         """
         self.channels = self.configuration["experiment"]["MicroscopeState"]["channels"]
-        self.available_channels = list(
-            map(
-                lambda c: int(c[len("channel_") :]),
-                filter(lambda k: self.channels[k]["is_selected"], self.channels.keys()),
-            )
-        )
+        selected_keys = [k for k, v in self.channels.items() if v["is_selected"]]
+        self.available_channels = [int(k[len("channel_") :]) for k in selected_keys]
+        self.next_channel = {}
+        if self.available_channels:
+            cycle = list(zip(self.available_channels, selected_keys))
+            self.next_channel[0] = cycle[0]
+            for (idx, _), next_channel in zip(cycle, cycle[1:] + cycle[:1]):
+                self.next_channel[idx] = next_channel
 
     def report_camera_settings(self) -> None:
         """Log the camera settings.
@@ -494,17 +501,14 @@ class Microscope:
         specified in the configuration file. It sets the sensor mode and the readout
         direction for the camera if it is in the light-sheet imaging mode.
         """
-        # Set Camera Sensor Mode - Must be done before camera is initialized.
-        sensor_mode = self.configuration["experiment"]["CameraParameters"][
+        camera_parameters = self.configuration["experiment"]["CameraParameters"][
             self.microscope_name
-        ]["sensor_mode"]
+        ]
+        # Set Camera Sensor Mode - Must be done before camera is initialized.
+        sensor_mode = camera_parameters["sensor_mode"]
         self.camera.set_sensor_mode(sensor_mode)
         if sensor_mode == "Light-Sheet":
-            self.camera.set_readout_direction(
-                self.configuration["experiment"]["CameraParameters"][
-                    self.microscope_name
-                ]["readout_direction"]
-            )
+            self.camera.set_readout_direction(camera_parameters["readout_direction"])
 
     def set_camera_roi(self) -> None:
         """Set the camera ROI.
@@ -515,20 +519,15 @@ class Microscope:
         the area of the image sensor that will be used to capture images during the
         acquisition process.
         """
-
-        img_width = self.configuration["experiment"]["CameraParameters"][
-            self.microscope_name
-        ]["x_pixels"]
-        img_height = self.configuration["experiment"]["CameraParameters"][
-            self.microscope_name
-        ]["y_pixels"]
-        center_x = self.configuration["experiment"]["CameraParameters"][
+        camera_parameters = self.configuration["experiment"]["CameraParameters"][
             self.microscope_name
-        ]["center_x"]
-        center_y = self.configuration["experiment"]["CameraParameters"][
-            self.microscope_name
-        ]["center_y"]
-        self.camera.set_ROI(img_width, img_height, center_x, center_y)
+        ]
+        self.camera.set_ROI(
+            camera_parameters["x_pixels"],
+            camera_parameters["y_pixels"],
+            camera_parameters["center_x"],
+            camera_parameters["center_y"],
+        )
 
     def end_acquisition(self) -> None:
         """End the acquisition.
@@ -618,48 +617,40 @@ class Microscope:
         sweep_times = {}
         microscope_state = self.configuration["experiment"]["MicroscopeState"]
         waveform_constants = self.configuration["waveform_constants"]
+        camera_parameters = self.configuration["experiment"]["CameraParameters"][
+            self.microscope_name
+        ]
+        camera_config = self.configuration["configuration"]["microscopes"][
+            self.microscope_name
+        ]["camera"]
+        other_constants = waveform_constants["other_constants"]
 
         logger.info(f"Microscope state: {repr(dict(microscope_state))}")
         logger.info(f"Waveform constants: {repr(dict(waveform_constants))}")
 
-        camera_delay = (
-            self.configuration["configuration"]["microscopes"][self.microscope_name][
-                "camera"
-            ]["delay"]
-            / 1000
-        )
-        camera_settle_duration = (
-            self.configuration["configuration"]["microscopes"][self.microscope_name][
-                "camera"
-            ].get("settle_duration", 0)
-            / 1000
-        )
+        camera_delay = camera_config["delay"] / 1000
+        camera_settle_duration = camera_config.get("settle_duration", 0) / 1000
         remote_focus_ramp_falling = (
-            float(waveform_constants["other_constants"]["remote_focus_ramp_falling"])
-            / 1000
+            float(other_constants["remote_focus_ramp_falling"]) / 1000
         )
 
         duty_cycle_wait_duration = (
-            float(waveform_constants["other_constants"]["remote_focus_settle_duration"])
-            / 1000
+            float(other_constants["remote_focus_settle_duration"]) / 1000
         )
-        ps = float(waveform_constants["other_constants"].get("percent_smoothing", 0.0))
+        ps = float(other_constants.get("percent_smoothing", 0.0))
 
         readout_time = 0
-        readout_mode = self.configuration["experiment"]["CameraParameters"][
-            self.microscope_name
-        ]["sensor_mode"]
+        readout_mode = camera_parameters["sensor_mode"]
 
         if readout_mode == "Normal":
             readout_time = self.camera.calculate_readout_time()
-        elif self.configuration["experiment"]["CameraParameters"][self.microscope_name][
-            "readout_direction"
-        ] in ["Bidirectional", "Rev. Bidirectional"]:
+        elif camera_parameters["readout_direction"] in [
+            "Bidirectional",
+            "Rev. Bidirectional",
+        ]:
             remote_focus_ramp_falling = 0
         # set readout out time
-        self.configuration["experiment"]["CameraParameters"][self.microscope_name][
-            "readout_time"
-        ] = (readout_time * 1000)
+        camera_parameters["readout_time"] = readout_time * 1000
 
         for channel_key in microscope_state["channels"].keys():
             channel = microscope_state["channels"][channel_key]
@@ -672,12 +663,7 @@ class Microscope:
                         _,
                         updated_exposure_time,
                     ) = self.camera.calculate_light_sheet_exposure_time(
-                        exposure_time,
-                        int(
-                            self.configuration["experiment"]["CameraParameters"][
-                                self.microscope_name
-                            ]["number_of_pixels"]
-                        ),
+                        exposure_time, int(camera_parameters["number_of_pixels"])
                     )
                     if updated_exposure_time != exposure_time:
                         print(
@@ -750,21 +736,15 @@ class Microscope:
             whether to override waveforms in the DAQ (create new tasks)
         """
         curr_channel = self.current_channel
-        prefix = "channel_"
-        if self.current_channel == 0:
-            self.current_channel = self.available_channels[0]
-        else:
-            idx = (self.available_channels.index(self.current_channel) + 1) % len(
-                self.available_channels
-            )
-            self.current_channel = self.available_channels[idx]
+        self.current_channel, channel_key = self.next_channel[curr_channel]
         if curr_channel == self.current_channel:
             return
 
-        channel_key = prefix + str(self.current_channel)
+        # Copy the channel settings out of the shared configuration in one call
+        # rather than paying a round trip to the manager for every field.
         channel = self.configuration["experiment"]["MicroscopeState"]["channels"][
             channel_key
-        ]
+        ].copy()
         # Filter Wheel Settings.
         for k in self.filter_wheel:
             self.filter_wheel[k].set_filter(channel[k])
@@ -774,15 +754,12 @@ class Microscope:
 
         # Laser Settings
         self.current_laser_index = channel["laser_index"]
+        laser_wavelength = self.laser_wavelength[self.current_laser_index]
+        laser_power = channel["laser_power"]
         for k in self.lasers:
             self.lasers[k].turn_off()
-        self.lasers[str(self.laser_wavelength[self.current_laser_index])].set_power(
-            channel["laser_power"]
-        )
-        logger.info(
-            f"{self.laser_wavelength[self.current_laser_index]} "
-            f"nm laser power set to {channel['laser_power']}"
-        )
+        self.lasers[str(laser_wavelength)].set_power(laser_power)
+        logger.info(f"{laser_wavelength} nm laser power set to {laser_power}")
         # self.lasers[str(self.laser_wavelength[self.current_laser_index])].turn_on()
 
         # stop daq before writing new waveform
@@ -817,24 +794,18 @@ class Microscope:
         channel : dict
             Dictionary of channel parameters.
         """
+        camera_parameters = self.configuration["experiment"]["CameraParameters"][
+            self.microscope_name
+        ]
         self.current_exposure_time = float(channel["camera_exposure_time"]) / 1000
-        if (
-            self.configuration["experiment"]["CameraParameters"][self.microscope_name][
-                "sensor_mode"
-            ]
-            == "Light-Sheet"
-        ):
+        if camera_parameters["sensor_mode"] == "Light-Sheet":
             (
                 self.current_exposure_time,
                 camera_line_interval,
                 _,
             ) = self.camera.calculate_light_sheet_exposure_time(
                 self.current_exposure_time,
-                int(
-                    self.configuration["experiment"]["CameraParameters"][
-                        self.microscope_name
-                    ]["number_of_pixels"]
-                ),
+                int(camera_parameters["number_of_pixels"]),
             )
             self.camera.set_line_interval(camera_line_interval)
             logger.info(f"Camera line interval set to {camera_line_interval}.")
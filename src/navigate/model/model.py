@@ -37,6 +37,7 @@ import time
 import os
 from typing import Tuple, Any, Dict, List, Optional, Union
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 
 # Third Party Imports
 import numpy as np
@@ -175,7 +176,7 @@ class Model:
         #: float: Time before acquisition.
         self.start_time = None
 
-        #: List[SharedNDArray]: Data buffer for image frames.
+        #: SharedNDArray: Ring buffer of image frames, indexed by frame id.
         self.data_buffer = None
 
         #: int: Number of active pixels in the x-dimension.
@@ -217,6 +218,19 @@ class Model:
         #: threading.Thread: Data thread.
         self.data_thread = None
 
+        #: ThreadPoolExecutor: Persistent worker that saves frames to disk. A single
+        # worker keeps frames in the order the data source expects them.
+        self.writer_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="ImageWriter"
+        )
+
+        #: concurrent.futures.Future: Most recently submitted saving job. The pool
+        # has a single worker, so it finishes after every earlier job.
+        self.last_write = None
+
+        #: Exception: First failure of a saving job since the last wait_for_writer.
+        self.write_error = None
+
         # show image function/pipe handler
         #: multiprocessing.connection.Connection: Show image pipe.
         self.show_img_pipe = None
@@ -258,6 +272,15 @@ class Model:
         #: bool: Ask to pause data thread?
         self.ask_to_pause_data_thread = False
 
+        #: event: Pause signal event.
+        self.pause_signal_event = threading.Event()
+
+        #: threading.Lock: Pause signal ready lock.
+        self.pause_signal_ready_lock = threading.Lock()
+
+        #: bool: Ask to pause the live signal thread?
+        self.ask_to_pause_signal_thread = False
+
         # data buffer for image frames
         #: int: Number of frames in the data buffer.
         self.number_of_frames = self.configuration["experiment"]["CameraParameters"][
@@ -265,6 +288,11 @@ class Model:
         ]
         self.update_data_buffer(self.img_width, self.img_height)
 
+        #: threading.BoundedSemaphore: Limits the number of frames queued for
+        # saving to fewer than the data buffer holds.
+        self.writer_slots_size = max(1, self.number_of_frames - 1)
+        self.writer_slots = threading.BoundedSemaphore(self.writer_slots_size)
+
         # Image Writer/Save functionality
         #: ImageWriter: Image writer.
         self.image_writer = None
@@ -408,10 +436,12 @@ class Model:
         """
         self.img_width = img_width
         self.img_height = img_height
-        self.data_buffer = [
-            SharedNDArray(shape=(img_height, img_width), dtype="uint16")
-            for _ in range(self.number_of_frames)
-        ]
+        shape = (self.number_of_frames, img_height, img_width)
+        if self.data_buffer is not None and self.data_buffer.shape == shape:
+            return
+        # A single shared memory block holds every frame, so the buffer is one
+        # segment to create, hand to the controller, and release.
+        self.data_buffer = SharedNDArray(shape=shape, dtype="uint16")
         self.data_buffer_positions = SharedNDArray(
             shape=(self.number_of_frames, 5), dtype=float
         )  # z-index, x, y, z, theta, f
@@ -423,7 +453,7 @@ class Model:
 
     def get_data_buffer(
         self, img_width: int = 512, img_height: int = 512
-    ) -> List[SharedNDArray]:
+    ) -> SharedNDArray:
         """Get the data buffer.
 
         If the number of active pixels in x and y changes, updates the data buffer and
@@ -438,7 +468,7 @@ class Model:
 
         Returns
         -------
-        data_buffer : List[SharedNDArray]
+        data_buffer : SharedNDArray
             Shared memory object.
         """
         if (
@@ -528,7 +558,7 @@ class Model:
             Dictionary of keyword arguments to pass to the command.
         """
         logging.info(f"Received command: {command}, {args}, {kwargs}")
-        if not self.data_buffer:
+        if self.data_buffer is None:
             logging.debug("Shared Memory Not Set Up.")
             return
 
@@ -632,9 +662,10 @@ class Model:
             ]
             if self.is_acquiring:
                 # We called this while in the middle of an acquisition
-                # stop live thread
-                self.stop_send_signal = True
-                self.signal_thread.join()
+                # hold the live thread between frames rather than restarting it
+                if self.imaging_mode != "live" or not self.pause_signal_thread():
+                    self.stop_send_signal = True
+                    self.signal_thread.join()
                 if microscope_name != self.active_microscope_name:
                     self.pause_data_thread()
                     self.active_microscope.end_acquisition()
@@ -663,10 +694,15 @@ class Model:
                 self.signal_container, self.data_container = load_features(
                     self, self.acquisition_modes_feature_setting[self.imaging_mode]
                 )
-                self.stop_send_signal = False
-                self.signal_thread = threading.Thread(target=self.run_live_acquisition)
-                self.signal_thread.name = "Waveform Popup Signal"
-                self.signal_thread.start()
+                if self.signal_thread.is_alive():
+                    self.resume_signal_thread()
+                else:
+                    self.stop_send_signal = False
+                    self.signal_thread = threading.Thread(
+                        target=self.run_live_acquisition
+                    )
+                    self.signal_thread.name = "Waveform Popup Signal"
+                    self.signal_thread.start()
 
         elif command == "autofocus":
             """Autofocus Routine
@@ -881,7 +917,12 @@ class Model:
             self.data_container.cleanup()
             delattr(self, "data_container")
         if self.image_writer is not None:
-            self.image_writer.close()
+            try:
+                self.wait_for_writer()
+            except Exception as e:
+                self.logger.error(f"Saving frames failed: {e}")
+            finally:
+                self.image_writer.close()
 
         #: obj: Add on feature.
         self.addon_feature = None
@@ -936,9 +977,15 @@ class Model:
 
             wait_num = self.camera_wait_iterations
 
+            # Hand the frames to the writer and the display before running the
+            # feature analysis, so neither waits on the other.
             # ImageWriter to save images
             if data_func:
-                data_func(frame_ids)
+                self.submit_write(data_func, frame_ids)
+
+            # show image
+            self.logger.info(f"Image delivered to controller: {frame_ids[-1]}")
+            self.show_img_pipe.send(frame_ids[-1])
 
             if hasattr(self, "data_container") and not self.data_container.end_flag:
                 if self.data_container.is_closed:
@@ -948,10 +995,6 @@ class Model:
 
                 self.data_container.run(frame_ids)
 
-            # show image
-            self.logger.info(f"Image delivered to controller: {frame_ids[0]}")
-            self.show_img_pipe.send(frame_ids[-1])
-
             if count_frame and acquired_frame_num >= num_of_frames:
                 self.logger.info("Loop stop condition met.")
                 self.stop_acquisition = True
@@ -966,6 +1009,55 @@ class Model:
 
         self.end_acquisition()  # Need this to turn off the lasers/close the shutters
 
+    def submit_write(self, data_func: callable, frame_ids: list) -> None:
+        """Queue frames for saving on the writer pool.
+
+        Blocks while fewer than len(frame_ids) of the number_of_frames - 1 writer
+        slots are free, which caps how many frames wait in the queue. It does not
+        pause the camera, which keeps filling the data buffer regardless.
+
+        The first failed save stops the acquisition.
+
+        Parameters
+        ----------
+        data_func : callable
+            Function that saves the frames.
+        frame_ids : list
+            Frame ids in the data buffer.
+        """
+        slots = min(len(frame_ids), self.writer_slots_size)
+        for _ in range(slots):
+            self.writer_slots.acquire()
+
+        def release_slots(future):
+            for _ in range(slots):
+                self.writer_slots.release()
+            if future.exception() is not None and self.write_error is None:
+                self.write_error = future.exception()
+                self.logger.error(f"Saving frames failed: {self.write_error}")
+                self.stop_send_signal = True
+                self.stop_acquisition = True
+
+        self.last_write = self.writer_pool.submit(data_func, frame_ids)
+        self.last_write.add_done_callback(release_slots)
+
+    def wait_for_writer(self) -> None:
+        """Block until every frame submitted to the writer pool has been saved.
+
+        Raises
+        ------
+        Exception
+            The first exception raised by any of the saving jobs.
+        """
+        if self.last_write is not None:
+            # The single worker runs each job's done-callbacks before it starts
+            # the next job, so an empty job returns once every callback has run.
+            self.writer_pool.submit(lambda: None).result()
+            self.last_write = None
+        error, self.write_error = self.write_error, None
+        if error is not None:
+            raise error
+
     def pause_data_thread(self) -> None:
         """Pause the data thread.
 
@@ -987,6 +1079,39 @@ class Model:
         if self.pause_data_ready_lock.locked():
             self.pause_data_ready_lock.release()
 
+    def pause_signal_thread(self) -> bool:
+        """Pause the live signal thread between two frames.
+
+        Function is called when settings change during live mode.
+
+        Returns
+        -------
+        paused : bool
+            False if the signal thread ended before it could be paused.
+        """
+        self.pause_signal_ready_lock.acquire()
+        self.ask_to_pause_signal_thread = True
+        while not self.pause_signal_ready_lock.acquire(timeout=0.1):
+            if not self.signal_thread.is_alive():
+                self.ask_to_pause_signal_thread = False
+                self.pause_signal_ready_lock.release()
+                return False
+        return True
+
+    def resume_signal_thread(self) -> None:
+        """Resume the live signal thread."""
+        self.ask_to_pause_signal_thread = False
+        self.pause_signal_event.set()
+        if self.pause_signal_ready_lock.locked():
+            self.pause_signal_ready_lock.release()
+
+    def wait_if_signal_paused(self) -> None:
+        """Block the signal thread while a pause is requested."""
+        if self.ask_to_pause_signal_thread:
+            self.pause_signal_event.clear()
+            self.pause_signal_ready_lock.release()
+            self.pause_signal_event.wait()
+
     def simplified_data_process(
         self,
         microscope: Microscope,
@@ -1127,6 +1252,7 @@ class Model:
         """
         self.stop_acquisition = False
         while not self.stop_acquisition and not self.stop_send_signal:
+            self.wait_if_signal_paused()
             self.run_acquisition()
             if self.injected_flag.value:
                 self.reset_feature_list()
@@ -1148,6 +1274,7 @@ class Model:
             and not self.stop_send_signal
             and not self.stop_acquisition
         ):
+            self.wait_if_signal_paused()
             self.snap_image()
             if not hasattr(self, "signal_container"):
                 return
@@ -1325,7 +1452,7 @@ class Model:
 
     def launch_virtual_microscope(
         self, microscope_name: str, microscope_config: Dict[str, Any]
-    ) -> List[SharedNDArray]:
+    ) -> SharedNDArray:
         """Launch a virtual microscope.
 
         Parameters
@@ -1337,8 +1464,8 @@ class Model:
 
         Returns
         -------
-        data_buffer : list
-            List of data buffer.
+        data_buffer : SharedNDArray
+            Data buffer.
         """
         img_height = self.configuration["experiment"]["CameraParameters"][
             microscope_name
@@ -1348,10 +1475,9 @@ class Model:
         ]["img_x_pixels"]
 
         # create data buffer
-        data_buffer = [
-            SharedNDArray(shape=(img_height, img_width), dtype="uint16")
-            for _ in range(self.number_of_frames)
-        ]
+        data_buffer = SharedNDArray(
+            shape=(self.number_of_frames, img_height, img_width), dtype="uint16"
+        )
 
         # create virtual microscope
         from navigate.model.devices import (
@@ -1438,13 +1564,13 @@ class Model:
         data_buffer = self.virtual_microscopes[microscope_name].data_buffer
         del self.virtual_microscopes[microscope_name]
         # delete shared_buffer
-        for i in range(self.number_of_frames):
-            data_buffer[i].shared_memory.close()
-            data_buffer[i].shared_memory.unlink()
+        data_buffer.shared_memory.close()
+        data_buffer.shared_memory.unlink()
         del data_buffer
 
     def terminate(self) -> None:
         """Terminate the model."""
+        self.writer_pool.shutdown(wait=True)
         self.active_microscope.terminate()
         for microscope_name in self.virtual_microscopes:
             self.virtual_microscopes[microscope_name].terminate()
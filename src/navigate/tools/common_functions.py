@@ -80,6 +80,10 @@ def build_ref_name(separator, *args):
 def copy_proxy_object(content):
     """This function will serialize proxy dict and list
 
+    Each proxy is fetched from the manager in a single call and the copy is
+    dispatched on the exact type of every value, so plain values are returned
+    without further checks.
+
     Parameters
     ----------
     content: dict/list
@@ -91,18 +95,17 @@ def copy_proxy_object(content):
     """
     from multiprocessing import managers
 
+    def copy_dict(content):
+        return {k: func(v) for k, v in content.copy().items()}
+
+    def copy_list(content):
+        return [func(v) for v in content[:]]
+
+    copy_funcs = {managers.DictProxy: copy_dict, managers.ListProxy: copy_list}
+
     def func(content):
-        if type(content) == managers.DictProxy:
-            result = {}
-            for k in content.keys():
-                result[k] = func(content[k])
-        elif type(content) == managers.ListProxy:
-            result = []
-            for v in content:
-                result.append(func(v))
-        else:
-            result = content
-        return result
+        copy_func = copy_funcs.get(type(content))
+        return copy_func(content) if copy_func else content
 
     return func(content)
 
@@ -98,11 +98,10 @@ def log_initialization(cls):
 
     # Get the original __init__ method
     original_init = cls.__init__
+    logger = logging.getLogger(cls.__module__.split(".")[1])
 
     @wraps(original_init)
     def new_init(self, *args, **kwargs):
-        module_location = cls.__module__
-        logger = logging.getLogger(module_location.split(".")[1])
         try:
             original_init(self, *args, **kwargs)
             logger.info(f"{cls.__name__}, " f"{args}, " f"{kwargs}")
@@ -44,6 +44,12 @@ from typing import Union
 # Local application imports
 from navigate.tools.common_functions import copy_proxy_object
 
+# Prefer the libyaml-backed loader when PyYAML was built against libyaml.
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 
 def get_ram_info() -> tuple:
     """Get computer RAM information.
@@ -153,7 +159,7 @@ def load_yaml_file(file_path: str) -> Union[dict, None]:
         return None
     with open(file_path) as f:
         try:
-            config_data = yaml.load(f, Loader=yaml.FullLoader)
+            config_data = yaml.load(f, Loader=YamlLoader)
         except yaml.YAMLError as yaml_error:
             print(f"Can't load yaml file: {file_path} - {yaml_error}")
             return None
@@ -32,6 +32,7 @@
 
 # Standard Library Imports
 import argparse
+import functools
 from pathlib import Path
 
 # Third Party Imports
@@ -158,9 +159,12 @@ def evaluate_parser_input_arguments(args):
     )
 
 
+@functools.lru_cache(maxsize=1)
 def create_parser():
     """Add Parser Input Arguments to ArgumentParser Object.
 
+    The parser is built once and reused by later calls.
+
     Returns
     -------
     parser : object
@@ -197,6 +201,14 @@ def create_parser():
         help="Enables debugging tool menu to be accessible.",
     )
 
+    input_args.add_argument(
+        "--no-splash",
+        required=False,
+        default=False,
+        action="store_true",
+        help="Start without the splash screen, e.g. for automated or headless runs.",
+    )
+
     # Non-Default Configuration and Experiment Input Arguments
     input_args.add_argument(
         "--config-file",
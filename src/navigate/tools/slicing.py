@@ -143,4 +143,75 @@ def ensure_slice(keys, pos):
         return val
     else:
         # Default to all values
-        return slice(None, None, None)
\ No newline at end of file
+        return slice(None, None, None)
+
+
+def _slice_to_range(val, shape):
+    """Convert a single channel/timepoint/position index to a range.
+
+    Parameters
+    ----------
+    val : int or slice
+        The index.
+    shape : int
+        The length of the dimension we are slicing.
+
+    Returns
+    -------
+    range
+        The range.
+    """
+    if isinstance(val, slice):
+        if val.start is None and val.stop is None and val.step is None:
+            return range(shape)
+        tmp = range(10**10)[val]
+        return range(min(tmp.start, shape), min(tmp.stop, shape), tmp.step)
+    if val + 1 > shape:
+        return range(shape - 1, shape)
+    return range(val, val + 1)
+
+
+def normalize_keys(keys, shape):
+    """Normalize the indices of a data source request in a single pass.
+
+    Equivalent to calling ensure_slice() for x, y and z and ensure_iter() for c, t
+    and p, but walks the keys only once.
+
+    Parameters
+    ----------
+    keys : int or slice or tuple
+        Indices ordered (x, y, c, z, t, p, subdivisions), optionally ending with
+        an Ellipsis.
+    shape : tuple
+        Length of the x, y, c, z, t and p dimensions.
+
+    Returns
+    -------
+    tuple
+        (xs, ys, cs, zs, ts, ps, subdivisions) where xs, ys and zs are slices,
+        cs, ts and ps are ranges and subdivisions is an int.
+    """
+    if isinstance(keys, (slice, int)):
+        keys = (keys,)
+    length = key_len(keys)
+    if length > 1 and keys[-1] is Ellipsis:
+        keys = keys[:-1]
+        length -= 1
+
+    normalized = []
+    for pos in range(6):
+        val = keys[pos] if pos < length else slice(None, None, None)
+        if pos in (2, 4, 5):
+            normalized.append(_slice_to_range(val, shape[pos]))
+        elif isinstance(val, int):
+            normalized.append(slice(val, val + 1, None))
+        else:
+            assert isinstance(val, slice)
+            normalized.append(val)
+
+    if length > 6 and isinstance(keys[6], int):
+        normalized.append(keys[6])
+    else:
+        normalized.append(0)
+
+    return tuple(normalized)
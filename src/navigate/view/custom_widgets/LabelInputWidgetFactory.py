@@ -50,6 +50,36 @@ from navigate.view.custom_widgets.hover import (
 p = __name__.split(".")[1]
 logger = logging.getLogger(p)
 
+#: frozenset: Input classes that carry their label as text instead of a ttk.Label.
+BUTTON_CLASSES = frozenset(
+    (
+        ttk.Checkbutton,
+        ttk.Button,
+        ttk.Radiobutton,
+        HoverButton,
+        HoverTkButton,
+        HoverCheckButton,
+        HoverRadioButton,
+    )
+)
+
+#: tuple: Button-style widget classes whose value is set by select()/deselect().
+SELECTABLE_CLASSES = (tk.Checkbutton, tk.Radiobutton)
+
+#: tuple: Themed button classes whose value is set through the "selected" state.
+TTK_SELECTABLE_CLASSES = (ttk.Checkbutton, ttk.Radiobutton)
+
+#: frozenset: Input classes whose options can be set through set_values().
+LIST_OPTION_CLASSES = frozenset(
+    (
+        ttk.Combobox,
+        tk.Listbox,
+        ttk.Spinbox,
+        ValidatedCombobox,
+        ValidatedSpinbox,
+    )
+)
+
 
 class LabelInput(ttk.Frame):
     """Widget class that contains label and input together.
@@ -124,15 +154,7 @@ class LabelInput(ttk.Frame):
         self.input_class = input_class
 
         """ Create widgets based on their type, considering formatting differences."""
-        if input_class in (
-            ttk.Checkbutton,
-            ttk.Button,
-            ttk.Radiobutton,
-            HoverButton,
-            HoverTkButton,
-            HoverCheckButton,
-            HoverRadioButton,
-        ):
+        if input_class in BUTTON_CLASSES:
             input_args["text"] = label
             input_args["variable"] = input_var
         else:
@@ -153,6 +175,33 @@ class LabelInput(ttk.Frame):
             self.widget.grid(row=0, column=1, sticky=(tk.W + tk.E))
             self.rowconfigure(0, weight=1)
 
+        # Pick the value getter once, so get() does not branch on every read.
+        if self.variable:
+            # Catches widgets that don't have text
+            self._get = self.variable.get
+        elif isinstance(self.widget, tk.Text):
+            # This is to account for the different formatting with Text widgets
+            self._get = lambda: self.widget.get("1.0", tk.END)
+        else:
+            # Catches all others like the normal entry widget
+            self._get = self.widget.get
+
+        # Same for the setter, so set() does not inspect types on every write.
+        if isinstance(self.variable, tk.BooleanVar):
+            self._set = self._set_boolean
+        elif self.variable:
+            self._set = self._set_variable
+        elif isinstance(self.widget, SELECTABLE_CLASSES):
+            self._set = self._set_button
+        elif isinstance(self.widget, TTK_SELECTABLE_CLASSES):
+            self._set = self._set_ttk_button
+        elif isinstance(self.widget, tk.Text):
+            self._set = self._set_text
+        elif isinstance(self.widget, ValidatedCombobox):
+            self._set = self._set_combobox
+        else:
+            self._set = self._set_entry
+
     def get(self, default=None):
         """Returns the value of the input widget
 
@@ -174,15 +223,7 @@ class LabelInput(ttk.Frame):
         >>> value = self.get()
         """
         try:
-            if self.variable:
-                return self.variable.get()  # Catches widgets that don't have text
-            elif isinstance(self.widget, tk.Text):
-                # This is to account for the different formatting with Text widgets
-                return self.widget.get("1.0", tk.END)
-            else:
-                return (
-                    self.widget.get()
-                )  # Catches all others like the normal entry widget
+            return self._get()
         except (TypeError, tk.TclError):
             # Catches times when a numeric entry input has a blank, since this
             # cannot be converted into a numeric value
@@ -216,38 +257,83 @@ class LabelInput(ttk.Frame):
         --------
         >>> self.set(value)
         """
-        if isinstance(self.variable, tk.BooleanVar):
-            # This will cast the value to bool if the variable is a Tk
-            # BooleanVar, bc Boolean.Var().set() can only accept bool type
-            # values
-            self.variable.set(bool(value))
-        elif self.variable:
-            # No casting needed this will set any of the other var types
-            # (String, Int, etc)
-            self.variable.set(value, *args, **kwargs)
-        elif type(self.widget).__name__.endswith(
-            "button"
-        ):  # Catches button style widgets
-            # The below if statment is needed for button types because it needs
-            # to be selected or enabled based on some value
-            if value:
-                self.widget.select()  # If there is a value select the button
-            else:
-                self.widget.deselect()  # If there is not deselect it
-        # Catches Text type objects so the Multiline Text widget and the Entry
-        # widget
-        elif isinstance(self.widget, tk.Text):
-            self.widget.delete("1.0", tk.END)
-            # These lines are used for the specfic formatting of the Text
-            # widget, 1 is the line and 0 is the char pos of that line
-            self.widget.insert("1.0", value)
-        elif isinstance(self.widget, ValidatedCombobox):
-            self.widget.current(self.widget["values"].index(value))
+        self._set(value, *args, **kwargs)
+
+    def _set_boolean(self, value, *args, **kwargs):
+        """Cast the value to bool, since BooleanVar.set() only accepts bool values
+
+        Parameters
+        ----------
+        value : object
+            The value to set the input widget to
+        """
+        self.variable.set(bool(value))
+
+    def _set_variable(self, value, *args, **kwargs):
+        """Set any other Tk variable (String, Int, etc.) without casting
+
+        Parameters
+        ----------
+        value : object
+            The value to set the input widget to
+        """
+        self.variable.set(value, *args, **kwargs)
+
+    def _set_button(self, value, *args, **kwargs):
+        """Select the button if the value is truthy, otherwise deselect it
+
+        Parameters
+        ----------
+        value : object
+            The value to set the input widget to
+        """
+        if value:
+            self.widget.select()
         else:
-            self.widget.delete(0, tk.END)
-            # Basic entry widget formatting, dont need the string as the first
-            # arg
-            self.widget.insert(0, value)
+            self.widget.deselect()
+
+    def _set_ttk_button(self, value, *args, **kwargs):
+        """Select the themed button if the value is truthy, otherwise deselect it
+
+        Parameters
+        ----------
+        value : object
+            The value to set the input widget to
+        """
+        self.widget.state(["selected" if value else "!selected"])
+
+    def _set_text(self, value, *args, **kwargs):
+        """Replace the contents of a multiline Text widget
+
+        Parameters
+        ----------
+        value : str
+            The value to set the input widget to
+        """
+        self.widget.delete("1.0", tk.END)
+        # 1 is the line and 0 is the char pos of that line
+        self.widget.insert("1.0", value)
+
+    def _set_combobox(self, value, *args, **kwargs):
+        """Select the combobox option matching the value
+
+        Parameters
+        ----------
+        value : str
+            The value to set the input widget to
+        """
+        self.widget.current(self.widget["values"].index(value))
+
+    def _set_entry(self, value, *args, **kwargs):
+        """Replace the contents of an entry widget
+
+        Parameters
+        ----------
+        value : str
+            The value to set the input widget to
+        """
+        self.widget.delete(0, tk.END)
+        self.widget.insert(0, value)
 
     def set_values(self, values):
         """Set values of a combobox
@@ -263,13 +349,7 @@ class LabelInput(ttk.Frame):
         values : list
             list of values to be set in the widget
         """
-        if self.input_class in (
-            ttk.Combobox,
-            tk.Listbox,
-            ttk.Spinbox,
-            ValidatedCombobox,
-            ValidatedSpinbox,
-        ):
+        if self.input_class in LIST_OPTION_CLASSES:
             self.widget["values"] = values
         else:
             logger.debug(
@@ -50,6 +50,30 @@ import navigate
 p = __name__.split(".")[1]
 logger = logging.getLogger(p)
 
+#: Path: Directory holding the stage control arrow images.
+IMAGE_DIRECTORY = Path(__file__).resolve().parent / "images"
+
+#: dict: Region (x0, y0, x1, y1) of each arrow image in the arrow atlas, keyed by
+#: the matching StageControlTab attribute.
+IMAGE_REGIONS = {
+    "up_1x_image": (0, 0, 120, 90),
+    "up_5x_image": (122, 0, 241, 30),
+    "down_1x_image": (244, 0, 364, 90),
+    "down_5x_image": (366, 0, 486, 31),
+    "left_1x_image": (0, 120, 90, 240),
+    "left_5x_image": (122, 120, 152, 239),
+    "right_1x_image": (244, 120, 334, 240),
+    "right_5x_image": (366, 120, 396, 239),
+    "d_up_1x_image": (0, 240, 120, 330),
+    "d_up_5x_image": (122, 240, 242, 271),
+    "d_down_1x_image": (244, 240, 364, 330),
+    "d_down_5x_image": (366, 240, 488, 273),
+    "d_left_1x_image": (0, 360, 90, 480),
+    "d_left_5x_image": (122, 360, 152, 479),
+    "d_right_1x_image": (244, 360, 334, 480),
+    "d_right_5x_image": (366, 360, 396, 479),
+}
+
 
 class StageControlNotebook(ttk.Notebook):
     """Notebook for stage control tab."""
@@ -154,6 +178,9 @@ class StageControlTab(tk.Frame):
 
         self.load_images()
 
+        #: tk.font.Font: Font of the step size labels, shared by the movement frames.
+        self.step_size_font = tk.font.Font(size=10)
+
         #: PositionFrame: Position frame.
         self.position_frame = PositionFrame(self)
         self.position_frame.grid(row=0, column=0, sticky=tk.NSEW, padx=3, pady=3)
@@ -180,38 +207,37 @@ class StageControlTab(tk.Frame):
         )
         self.stop_frame.grid(row=1, column=1, sticky=tk.NSEW, padx=3, pady=3)
 
+        #: dict: Position and step size widgets, keyed by name.
+        self.widget_dict = {**self.position_frame.get_widgets()}
+        for axis in ["xy", "z", "theta", "f"]:
+            self.widget_dict[axis + "_step"] = getattr(
+                self, axis + "_frame"
+            ).get_widget()
+
+        #: dict: Tk variables of the position and step size widgets, keyed by name.
+        self.variable_dict = {
+            k: widget.get_variable() for k, widget in self.widget_dict.items()
+        }
+
+        #: dict: Movement, stop and joystick buttons, keyed by name.
+        self.button_dict = {**self.xy_frame.get_buttons()}
+        for axis in ["z", "theta", "f"]:
+            temp = getattr(self, axis + "_frame").get_buttons()
+            self.button_dict.update({k + "_" + axis + "_btn": temp[k] for k in temp})
+        self.button_dict.update(self.stop_frame.get_buttons())
+
     def load_images(self) -> None:
-        """Load images for the stage control tab."""
-
-        # Path to arrows
-        image_directory = Path(__file__).resolve().parent
-        image_names = [
-            "up_1x_image",
-            "up_5x_image",
-            "down_1x_image",
-            "down_5x_image",
-            "left_1x_image",
-            "left_5x_image",
-            "right_1x_image",
-            "right_5x_image",
-            "d_up_1x_image",
-            "d_up_5x_image",
-            "d_down_1x_image",
-            "d_down_5x_image",
-            "d_left_1x_image",
-            "d_left_5x_image",
-            "d_right_1x_image",
-            "d_right_5x_image",
-        ]
-
-        for name in image_names:
-            setattr(
-                self,
-                f"{name}",
-                tk.PhotoImage(
-                    file=image_directory.joinpath("images", f"{name}.png")
-                ).subsample(2, 2),
-            )
+        """Load images for the stage control tab.
+
+        All arrows live in one atlas, so a single PNG is decoded. Each arrow is
+        copied out of it at half size and shared by the XY, Z, Theta and Focus
+        frames.
+        """
+        atlas = tk.PhotoImage(master=self, file=IMAGE_DIRECTORY / "arrows_atlas.png")
+        for name, region in IMAGE_REGIONS.items():
+            image = tk.PhotoImage(master=self)
+            image.tk.call(image, "copy", atlas, "-from", *region, "-subsample", 2, 2)
+            setattr(self, name, image)
 
     def get_widgets(self) -> dict:
         """Get all widgets in the stage control tab.
@@ -221,10 +247,7 @@ class StageControlTab(tk.Frame):
         widgets: dict
             Dictionary of widgets
         """
-        temp = {**self.position_frame.get_widgets()}
-        for axis in ["xy", "z", "theta", "f"]:
-            temp[axis + "_step"] = getattr(self, axis + "_frame").get_widget()
-        return temp
+        return self.widget_dict
 
     def get_variables(self) -> dict:
         """Get all variables in the stage control tab.
@@ -234,8 +257,7 @@ class StageControlTab(tk.Frame):
         variables: dict
             Dictionary of variables
         """
-        temp = self.get_widgets()
-        return {k: temp[k].get_variable() for k in temp}
+        return self.variable_dict
 
     def get_buttons(self) -> dict:
         """Get all buttons in the stage control tab.
@@ -245,12 +267,7 @@ class StageControlTab(tk.Frame):
         buttons: dict
             Dictionary of buttons
         """
-        result = {**self.xy_frame.get_buttons()}
-        for axis in ["z", "theta", "f"]:
-            temp = getattr(self, axis + "_frame").get_buttons()
-            result.update({k + "_" + axis + "_btn": temp[k] for k in temp})
-        result.update(self.stop_frame.get_buttons())
-        return result
+        return self.button_dict
 
     def toggle_button_states(
         self, joystick_is_on: bool = False, joystick_axes: Optional[list] = None
@@ -325,12 +342,17 @@ class OtherAxisFrame(ttk.Labelframe):
         #: str: Name of the axis.
         self.name = name
 
+        #: frozenset: Joystick axis names that control this frame.
+        self.axis_keys = frozenset(
+            {name.lower(), "f"} if name.lower() == "focus" else {name.lower()}
+        )
+
         #: StageControlTab: Stage control tab.
         self.stage_control_tab = stage_control_tab
 
         #: HoverTkButton: Up button.
         self.up_btn = HoverTkButton(
-            self, image=self.stage_control_tab.d_up_1x_image, borderwidth=0
+            self, image=self.stage_control_tab.up_1x_image, borderwidth=0
         )
 
         #: HoverTkButton: 5x Up button.
@@ -348,6 +370,32 @@ class OtherAxisFrame(ttk.Labelframe):
             self, image=self.stage_control_tab.down_5x_image, borderwidth=0
         )
 
+        tab = self.stage_control_tab
+        #: dict: Button images for each button state, ordered up, down, large
+        #: down, large up.
+        self.button_images = {
+            "normal": (
+                tab.up_1x_image,
+                tab.down_1x_image,
+                tab.down_5x_image,
+                tab.up_5x_image,
+            ),
+            "disabled": (
+                tab.d_up_1x_image,
+                tab.d_down_1x_image,
+                tab.d_down_5x_image,
+                tab.d_up_5x_image,
+            ),
+        }
+
+        #: tuple: Movement buttons, in the order of button_images.
+        self.buttons = (
+            self.up_btn,
+            self.down_btn,
+            self.large_down_btn,
+            self.large_up_btn,
+        )
+
         if self.name.lower() == "theta":
             text = "Step Size (" + "\N{DEGREE SIGN}" + ")"
         else:
@@ -361,7 +409,7 @@ class OtherAxisFrame(ttk.Labelframe):
             input_args={"width": 5},
             label=text,
             label_pos="top",
-            label_args={"font": tk.font.Font(size=10)},
+            label_args={"font": self.stage_control_tab.step_size_font},
         )
 
         # Center the widgets laterally.
@@ -435,44 +483,16 @@ class OtherAxisFrame(ttk.Labelframe):
             A list containing the axes controlled by the joystick, if any
         """
 
-        normal_images = [
-            self.stage_control_tab.up_1x_image,
-            self.stage_control_tab.down_1x_image,
-            self.stage_control_tab.down_5x_image,
-            self.stage_control_tab.up_5x_image,
-        ]
-
-        disabled_images = [
-            self.stage_control_tab.d_up_1x_image,
-            self.stage_control_tab.d_down_1x_image,
-            self.stage_control_tab.d_down_5x_image,
-            self.stage_control_tab.d_up_5x_image,
-        ]
-
-        buttons = [
-            self.up_btn,
-            self.down_btn,
-            self.large_down_btn,
-            self.large_up_btn,
-        ]
-
         if joystick_axes is None:
             joystick_axes = []
 
         # Default Button State
         button_state = "normal"
-        image_list = normal_images
+        if joystick_is_on and not self.axis_keys.isdisjoint(joystick_axes):
+            button_state = "disabled"
 
-        if joystick_is_on:
-            if (self.name.lower() in joystick_axes) or (
-                self.name.lower() == "focus" and "f" in joystick_axes
-            ):
-                button_state = "disabled"
-                image_list = disabled_images
-
-        for k in range(len(buttons)):
-            buttons[k]["state"] = button_state
-            buttons[k].config(image=image_list[k])
+        for button, image in zip(self.buttons, self.button_images[button_state]):
+            button.configure(state=button_state, image=image)
 
 
 class PositionFrame(ttk.Labelframe):
@@ -509,12 +529,17 @@ class PositionFrame(ttk.Labelframe):
         #: list: List of labels for the position entries.
         entry_labels = ["X", "Y", "Z", "\N{Greek Capital Theta Symbol}", "F"]
 
-        #: list: List of frames for the position entries.
-        self.frame_back_list = []
-        for i in range(len(entry_names)):
-            self.inputs[entry_names[i]] = LabelInput(
+        #: dict: Background frame behind each position entry, keyed by axis.
+        self.frame_back = {}
+        for row, (name, label) in enumerate(zip(entry_names, entry_labels)):
+            # Created before the entry, so it already sits below it in the
+            # stacking order and needs no lower() call.
+            frame_back = tk.Frame(self, bg="#f0f0f0", width=60, height=26)
+            frame_back.grid(row=row, column=0)
+            self.frame_back[name] = frame_back
+            self.inputs[name] = LabelInput(
                 parent=self,
-                label=entry_labels[i],
+                label=label,
                 input_class=ValidatedEntry,
                 input_var=tk.StringVar(),
                 input_args={
@@ -524,12 +549,7 @@ class PositionFrame(ttk.Labelframe):
                     "takefocus": False,
                 },
             )
-            self.frame_back_list.append(
-                tk.Frame(self, bg="#f0f0f0", width=60, height=26)
-            )
-            self.frame_back_list[i].grid(row=i, column=0)
-            self.inputs[entry_names[i]].grid(row=i, column=0)
-            self.frame_back_list[i].lower()
+            self.inputs[name].grid(row=row, column=0)
 
     def get_widgets(self) -> dict:
         """Get all widgets in the position frame
@@ -573,7 +593,6 @@ class PositionFrame(ttk.Labelframe):
         if joystick_axes is None:
             joystick_axes = []
 
-        frame_back_counter = 0
         if joystick_is_on:
             entry_state = "disabled"
             frame_back_color = "#ee868a"
@@ -581,15 +600,12 @@ class PositionFrame(ttk.Labelframe):
             entry_state = "normal"
             frame_back_color = "#f0f0f0"
 
-        for variable in self.get_variables():
-            if variable in joystick_axes:
-                self.frame_back_list[frame_back_counter]["bg"] = frame_back_color
-                try:
-                    self.inputs[f"{variable}"].widget["state"] = entry_state
-
-                except KeyError:
-                    pass
-            frame_back_counter += 1
+        for axis in joystick_axes:
+            frame_back = self.frame_back.get(axis)
+            if frame_back is None:
+                continue
+            frame_back["bg"] = frame_back_color
+            self.inputs[axis].widget["state"] = entry_state
 
 
 class XYFrame(ttk.Labelframe):
@@ -673,7 +689,7 @@ class XYFrame(ttk.Labelframe):
             input_args={"width": 5},
             label="Step Size (\N{GREEK SMALL LETTER MU}m)",
             label_pos="top",
-            label_args={"font": tk.font.Font(size=10)},
+            label_args={"font": self.stage_control_tab.step_size_font},
         )
 
         #: dict: Dictionary of the buttons for the x and y movement buttons.
@@ -692,6 +708,52 @@ class XYFrame(ttk.Labelframe):
             ],
         }
 
+        #: dict: Movement buttons, keyed by attribute name.
+        self.button_dict = {
+            "up_x_btn": self.up_x_btn,
+            "down_x_btn": self.down_x_btn,
+            "up_y_btn": self.up_y_btn,
+            "down_y_btn": self.down_y_btn,
+            "large_up_x_btn": self.large_up_x_btn,
+            "large_down_x_btn": self.large_down_x_btn,
+            "large_up_y_btn": self.large_up_y_btn,
+            "large_down_y_btn": self.large_down_y_btn,
+        }
+
+        tab = self.stage_control_tab
+        #: dict: Button images for each axis and button state, in the order of
+        #: button_axes_dict.
+        self.axis_images = {
+            "x": {
+                "normal": (
+                    tab.right_1x_image,
+                    tab.left_1x_image,
+                    tab.right_5x_image,
+                    tab.left_5x_image,
+                ),
+                "disabled": (
+                    tab.d_right_1x_image,
+                    tab.d_left_1x_image,
+                    tab.d_right_5x_image,
+                    tab.d_left_5x_image,
+                ),
+            },
+            "y": {
+                "normal": (
+                    tab.up_1x_image,
+                    tab.down_1x_image,
+                    tab.up_5x_image,
+                    tab.down_5x_image,
+                ),
+                "disabled": (
+                    tab.d_up_1x_image,
+                    tab.d_down_1x_image,
+                    tab.d_up_5x_image,
+                    tab.d_down_5x_image,
+                ),
+            },
+        }
+
         # Up
         self.large_up_y_btn.grid(
             row=0, column=4, rowspan=2, columnspan=2, padx=2, pady=2
@@ -754,17 +816,7 @@ class XYFrame(ttk.Labelframe):
             A dictionary of the buttons
         """
 
-        names = [
-            "up_x_btn",
-            "down_x_btn",
-            "up_y_btn",
-            "down_y_btn",
-            "large_up_x_btn",
-            "large_down_x_btn",
-            "large_up_y_btn",
-            "large_down_y_btn",
-        ]
-        return {k: getattr(self, k) for k in names}
+        return self.button_dict
 
     def toggle_button_states(
         self, joystick_is_on: bool = False, joystick_axes: Optional[list] = None
@@ -780,48 +832,13 @@ class XYFrame(ttk.Labelframe):
         if joystick_axes is None:
             joystick_axes = []
 
-            # Default Button State
-        button_state = "normal"
-        image_list = {
-            "x": [
-                self.stage_control_tab.right_1x_image,
-                self.stage_control_tab.left_1x_image,
-                self.stage_control_tab.right_5x_image,
-                self.stage_control_tab.left_5x_image,
-            ],
-            "y": [
-                self.stage_control_tab.up_1x_image,
-                self.stage_control_tab.down_1x_image,
-                self.stage_control_tab.up_5x_image,
-                self.stage_control_tab.down_5x_image,
-            ],
-        }
-
-        if joystick_is_on:
-            if "x" in joystick_axes:
-                button_state = "disabled"
-                image_list["x"] = [
-                    self.stage_control_tab.d_right_1x_image,
-                    self.stage_control_tab.d_left_1x_image,
-                    self.stage_control_tab.d_right_5x_image,
-                    self.stage_control_tab.d_left_5x_image,
-                ]
-            if "y" in joystick_axes:
+        for axis, buttons in self.button_axes_dict.items():
+            if joystick_is_on and axis in joystick_axes:
                 button_state = "disabled"
-                image_list["y"] = [
-                    self.stage_control_tab.d_up_1x_image,
-                    self.stage_control_tab.d_down_1x_image,
-                    self.stage_control_tab.d_up_5x_image,
-                    self.stage_control_tab.d_down_5x_image,
-                ]
-
-        for k, button in enumerate(self.button_axes_dict["x"]):
-            button["state"] = button_state
-            button.config(image=image_list["x"][k])
-
-        for k, button in enumerate(self.button_axes_dict["y"]):
-            button["state"] = button_state
-            button.config(image=image_list["y"][k])
+            else:
+                button_state = "normal"
+            for button, image in zip(buttons, self.axis_images[axis][button_state]):
+                button.configure(state=button_state, image=image)
 
 
 class StopFrame(ttk.Labelframe):
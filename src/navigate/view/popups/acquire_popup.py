@@ -34,8 +34,7 @@
 import logging
 from tkinter import ttk
 import tkinter as tk
-from tkinter.scrolledtext import ScrolledText
-import platform
+import sys
 
 # Third Party Imports
 
@@ -53,6 +52,58 @@ logger = logging.getLogger(p)
 
 SOLVENTS = ("BABB", "Water", "CUBIC", "CLARITY", "uDISCO", "eFLASH")
 
+#: tuple: Name and label of each entry in the file saving popup, in display order.
+ENTRY_FIELDS = (
+    ("root_directory", "Root Directory"),
+    ("user", "User"),
+    ("tissue", "Tissue Type"),
+    ("celltype", "Cell Type"),
+    ("label", "Label"),
+    ("prefix", "Prefix"),
+    ("solvent", "Solvent"),
+    ("file_type", "File Type"),
+)
+
+#: dict: Values and default of the entries shown as read-only comboboxes.
+COMBOBOX_FIELDS = {
+    "solvent": (SOLVENTS, "BABB"),
+    "file_type": (tuple(FILE_TYPES), "TIFF"),
+}
+
+#: tuple: Maximum lateral and axial down-sampling factors offered for BDV files.
+DOWN_SAMPLE_VALUES = ("1x", "2x", "4x", "8x", "16x", "32x", "64x", "128x")
+
+#: dict: Grid options for the frames and separators that split the popup into
+#: sections.
+SECTION_GRID = {"sticky": tk.NSEW, "padx": 0, "pady": 3}
+
+#: dict: Grid options for the BDV setting inputs.
+INPUT_GRID = {"sticky": tk.W, "padx": (5, 5), "pady": (1, 1)}
+
+
+def add_separator(parent: tk.Widget, row: int) -> ttk.Separator:
+    """Add a horizontal separator across the three columns of a settings tab.
+
+    Parameters
+    ----------
+    parent : tk.Widget
+        The tab to add the separator to.
+    row : int
+        The grid row of the separator.
+
+    Returns
+    -------
+    ttk.Separator
+        The separator.
+    """
+    separator = ttk.Separator(parent, orient="horizontal")
+    separator.grid(row=row, column=0, columnspan=3, **SECTION_GRID)
+    return separator
+
+
+#: tuple: Width and height of the file saving popup on this platform.
+POPUP_SIZE = (450, 710) if sys.platform == "win32" else (580, 730)
+
 
 class AcquirePopUp(CommonMethods):
     """Class creates the popup that is generated when the Acquire button is pressed and
@@ -75,25 +126,16 @@ class AcquirePopUp(CommonMethods):
         #: int: Width of the second column
         self.column2_width = 40
 
+        #: int: Width and height of the popup window
+        self.global_width, self.global_height = POPUP_SIZE
+
         #: PopUp: The popup window
-        if platform.system() == "Windows":
-            self.global_width = 450
-            self.global_height = 710
-            self.popup = PopUp(
-                root,
-                name="File Saving Dialog",
-                size=f"{self.global_width}x{self.global_height}+320+180",
-                transient=True,
-            )
-        else:
-            self.global_width = 580
-            self.global_height = 730
-            self.popup = PopUp(
-                root,
-                name="File Saving Dialog",
-                size=f"{self.global_width}x{self.global_height}+320+180",
-                transient=True,
-            )
+        self.popup = PopUp(
+            root,
+            name="File Saving Dialog",
+            size=f"{self.global_width}x{self.global_height}+320+180",
+            transient=True,
+        )
 
         #: dict: Button dictionary.
         self.buttons = {}
@@ -111,19 +153,19 @@ class AcquirePopUp(CommonMethods):
         separator1 = ttk.Separator(content_frame, orient="horizontal")
         separator2 = ttk.Separator(content_frame, orient="horizontal")
 
-        path_entries.grid(row=0, column=0, sticky=tk.NSEW, padx=0, pady=3)
+        path_entries.grid(row=0, column=0, **SECTION_GRID)
         path_entries.grid_columnconfigure(index=0, weight=1)
         path_entries.grid_rowconfigure(index=1, weight=1)
 
-        separator1.grid(row=1, column=0, sticky=tk.NSEW, padx=0, pady=3)
+        separator1.grid(row=1, column=0, **SECTION_GRID)
 
-        tab_frame.grid(row=2, column=0, sticky=tk.NSEW, padx=0, pady=3)
+        tab_frame.grid(row=2, column=0, **SECTION_GRID)
         tab_frame.grid_columnconfigure(index=0, weight=1)
         tab_frame.grid_rowconfigure(index=1, weight=1)
 
-        separator2.grid(row=3, column=0, sticky=tk.NSEW, padx=0, pady=3)
+        separator2.grid(row=3, column=0, **SECTION_GRID)
 
-        button_frame.grid(row=4, column=0, sticky=tk.NSEW, padx=0, pady=3)
+        button_frame.grid(row=4, column=0, **SECTION_GRID)
         button_frame.grid_columnconfigure(index=0, weight=1)
         button_frame.grid_rowconfigure(index=1, weight=1)
 
@@ -169,7 +211,6 @@ class EntryFrame:
         frame : ttk.Frame
             The EntryFrame Window.
         """
-        row_index = 0
         text = "Please Fill Out the Fields Below"
 
         #: ttk.Label: Label for the entries
@@ -177,64 +218,32 @@ class EntryFrame:
         label.grid(row=0, column=0, columnspan=2, sticky=tk.NSEW, pady=5, padx=0)
 
         # Creating Entry Widgets
-        entry_names = [
-            "root_directory",
-            "user",
-            "tissue",
-            "celltype",
-            "label",
-            "prefix",
-            "solvent",
-            "file_type",
-        ]
-
-        entry_labels = [
-            "Root Directory",
-            "User",
-            "Tissue Type",
-            "Cell Type",
-            "Label",
-            "Prefix",
-            "Solvent",
-            "File Type",
-        ]
-
-        # Loop for each entry and label
-        row_index += 1
-        for i in range(len(entry_names)):
-            if entry_names[i] == "file_type":
-                parent.inputs[entry_names[i]] = LabelInput(
+        label_args = {"width": parent.column1_width}
+        for row_index, (name, label_text) in enumerate(ENTRY_FIELDS, start=1):
+            if name in COMBOBOX_FIELDS:
+                values, default = COMBOBOX_FIELDS[name]
+                widget = LabelInput(
                     parent=frame,
-                    label=entry_labels[i],
+                    label=label_text,
                     input_class=ValidatedCombobox,
                     input_var=tk.StringVar(),
+                    label_args=label_args,
                 )
-                parent.inputs[entry_names[i]].widget.state(["!disabled", "readonly"])
-                parent.inputs[entry_names[i]].set_values(tuple(FILE_TYPES))
-                parent.inputs[entry_names[i]].set("TIFF")
-
-            elif entry_names[i] == "solvent":
-                parent.inputs[entry_names[i]] = LabelInput(
-                    parent=frame,
-                    label=entry_labels[i],
-                    input_class=ValidatedCombobox,
-                    input_var=tk.StringVar(),
-                )
-                parent.inputs[entry_names[i]].widget.state(["!disabled", "readonly"])
-                parent.inputs[entry_names[i]].set_values(SOLVENTS)
-                parent.inputs[entry_names[i]].set("BABB")
-
+                widget.widget.state(["!disabled", "readonly"])
+                widget.set_values(values)
+                widget.set(default)
             else:
-                parent.inputs[entry_names[i]] = LabelInput(
+                widget = LabelInput(
                     parent=frame,
-                    label=entry_labels[i],
+                    label=label_text,
                     input_class=ttk.Entry,
                     input_var=tk.StringVar(),
                     input_args={"width": parent.column2_width},
+                    label_args=label_args,
                 )
+            parent.inputs[name] = widget
 
-            # Widgets
-            parent.inputs[entry_names[i]].grid(
+            widget.grid(
                 row=row_index,
                 column=0,
                 columnspan=1,
@@ -242,12 +251,8 @@ class EntryFrame:
                 padx=(0, 0),
                 pady=(1, 1),
             )
-
-            # Labels
-            parent.inputs[entry_names[i]].label.grid(padx=(5, 5))
-            parent.inputs[entry_names[i]].label.config(width=parent.column1_width)
-            parent.inputs[entry_names[i]].widget.grid(padx=(0, 0), pady=(1, 1))
-            row_index += 1
+            widget.label.grid(padx=(5, 5))
+            widget.widget.grid(pady=(1, 1))
 
 
 class TabFrame:
@@ -264,10 +269,10 @@ class TabFrame:
         notebook = ttk.Notebook(frame, padding=(5, 2, 5, 2))
         notebook.grid(row=0, column=0, sticky=tk.NSEW)
 
-        tab1 = tk.Frame(notebook)
+        tab1 = ttk.Frame(notebook)
         tab1.columnconfigure(index=0, weight=1)
 
-        tab2 = tk.Frame(notebook)
+        tab2 = ttk.Frame(notebook)
         tab2.columnconfigure(index=0, weight=1)
         tab2.columnconfigure(index=1, weight=1)
         tab2.columnconfigure(index=2, weight=1)
@@ -279,7 +284,7 @@ class TabFrame:
 
         text = "All notes are saved in to the header of the image file."
 
-        notes_label = tk.Label(
+        notes_label = ttk.Label(
             tab1,
             text=text,
             justify=tk.LEFT,
@@ -297,23 +302,22 @@ class TabFrame:
         )
 
         row_index += 2
-        separator1 = ttk.Separator(tab1, orient="horizontal")
-
-        separator1.grid(
-            row=row_index, column=0, columnspan=3, sticky=tk.NSEW, padx=0, pady=3
-        )
+        add_separator(tab1, row_index)
 
         row_index += 1
-        self.inputs = {
-            "misc": ScrolledText(
-                tab1,
-                wrap=tk.WORD,
-                height=20,
-                width=parent.column2_width + parent.column2_width - 35,
-            )
-        }
+        misc_text = tk.Text(
+            tab1,
+            wrap=tk.WORD,
+            height=20,
+            width=parent.column2_width + parent.column2_width - 35,
+        )
+        misc_scrollbar = ttk.Scrollbar(tab1, command=misc_text.yview)
+        misc_text.configure(yscrollcommand=misc_scrollbar.set)
+        misc_text.grid(row=row_index, column=0, columnspan=1, sticky=tk.NSEW)
+        misc_scrollbar.grid(row=row_index, column=1, sticky=tk.NS)
 
-        self.inputs["misc"].grid(row=row_index, column=0, columnspan=1, sticky=tk.NSEW)
+        #: dict: Input dictionary.
+        self.inputs = {"misc": misc_text}
 
         row_index = 0
         text = (
@@ -322,7 +326,7 @@ class TabFrame:
             "All angles are in degrees."
         )
 
-        bdv_label = tk.Label(
+        bdv_label = ttk.Label(
             tab2,
             text=text,
             justify=tk.LEFT,
@@ -368,7 +372,7 @@ class TabFrame:
         )
 
         self.inputs["shear_dimension"].grid(
-            row=row_index, column=1, columnspan=1, sticky=tk.W, padx=(5, 5), pady=(1, 1)
+            row=row_index, column=1, columnspan=1, **INPUT_GRID
         )
 
         self.inputs["shear_angle"] = LabelInput(
@@ -384,15 +388,11 @@ class TabFrame:
             },
         )
         self.inputs["shear_angle"].grid(
-            row=row_index, column=2, columnspan=1, sticky=tk.W, padx=(5, 5), pady=(1, 1)
+            row=row_index, column=2, columnspan=1, **INPUT_GRID
         )
 
         row_index += 1
-        separator1 = ttk.Separator(tab2, orient="horizontal")
-
-        separator1.grid(
-            row=row_index, column=0, columnspan=3, sticky=tk.NSEW, padx=0, pady=3
-        )
+        add_separator(tab2, row_index)
 
         row_index += 1
         self.inputs["rotate_data"] = LabelInput(
@@ -432,9 +432,7 @@ class TabFrame:
             },
         )
 
-        self.inputs["rotate_angle_x"].grid(
-            row=0, column=0, columnspan=1, sticky=tk.W, padx=(5, 5), pady=(1, 1)
-        )
+        self.inputs["rotate_angle_x"].grid(row=0, column=0, columnspan=1, **INPUT_GRID)
 
         self.inputs["rotate_angle_y"] = LabelInput(
             parent=rotate_notebook,
@@ -448,9 +446,7 @@ class TabFrame:
                 "increment": 1,
             },
         )
-        self.inputs["rotate_angle_y"].grid(
-            row=0, column=1, columnspan=1, sticky=tk.W, padx=(5, 5), pady=(1, 1)
-        )
+        self.inputs["rotate_angle_y"].grid(row=0, column=1, columnspan=1, **INPUT_GRID)
 
         self.inputs["rotate_angle_z"] = LabelInput(
             parent=rotate_notebook,
@@ -464,22 +460,13 @@ class TabFrame:
                 "increment": 1,
             },
         )
-        self.inputs["rotate_angle_z"].grid(
-            row=0, column=2, columnspan=1, sticky=tk.W, padx=(5, 5), pady=(1, 1)
-        )
+        self.inputs["rotate_angle_z"].grid(row=0, column=2, columnspan=1, **INPUT_GRID)
 
         row_index += 1
-        separator1 = ttk.Separator(tab2, orient="horizontal")
-
-        separator1.grid(
-            row=row_index, column=0, columnspan=3, sticky=tk.NSEW, padx=0, pady=3
-        )
+        add_separator(tab2, row_index)
 
         row_index += 1
-        separator2 = ttk.Separator(tab2, orient="horizontal")
-        separator2.grid(
-            row=row_index, column=0, columnspan=3, sticky=tk.NSEW, padx=0, pady=3
-        )
+        add_separator(tab2, row_index)
 
         row_index += 1
         self.inputs["down_sample_data"] = LabelInput(
@@ -500,39 +487,34 @@ class TabFrame:
             pady=(1, 1),
         )
 
-        values = ["1x", "2x", "4x", "8x", "16x", "32x", "64x", "128x"]
         self.inputs["lateral_down_sample"] = LabelInput(
             parent=tab2,
             label_pos="top",
             label="Lateral Downsample",
             input_class=ttk.Combobox,
             input_var=tk.StringVar(),
-            input_args={"values": values, "state": "readonly"},
+            input_args={"values": DOWN_SAMPLE_VALUES, "state": "readonly"},
         )
 
         self.inputs["lateral_down_sample"].grid(
-            row=row_index, column=1, columnspan=1, sticky=tk.W, padx=(5, 5), pady=(1, 1)
+            row=row_index, column=1, columnspan=1, **INPUT_GRID
         )
 
-        values = ["1x", "2x", "4x", "8x", "16x", "32x", "64x", "128x"]
         self.inputs["axial_down_sample"] = LabelInput(
             parent=tab2,
             label_pos="top",
             label="Axial Downsample",
             input_class=ttk.Combobox,
             input_var=tk.StringVar(),
-            input_args={"values": values, "state": "readonly"},
+            input_args={"values": DOWN_SAMPLE_VALUES, "state": "readonly"},
         )
 
         self.inputs["axial_down_sample"].grid(
-            row=row_index, column=2, columnspan=1, sticky=tk.W, padx=(5, 5), pady=(1, 1)
+            row=row_index, column=2, columnspan=1, **INPUT_GRID
         )
 
         row_index += 1
-        separator3 = ttk.Separator(tab2, orient="horizontal")
-        separator3.grid(
-            row=row_index, column=0, columnspan=3, sticky=tk.NSEW, padx=0, pady=3
-        )
+        add_separator(tab2, row_index)
 
         row_index += 1
         text = (
@@ -542,7 +524,7 @@ class TabFrame:
             "automatically be calculated. "
         )
 
-        bdv_label2 = tk.Label(
+        bdv_label2 = ttk.Label(
             tab2,
             text=text,
             justify=tk.LEFT,
@@ -32,12 +32,31 @@
 
 # Standard Library Imports
 import tkinter as tk
+from functools import lru_cache
 
 # Third Party Imports
 
 # Local Imports
 
 
+@lru_cache(maxsize=4)
+def read_image_bytes(image_path) -> bytes:
+    """Read an image file once and keep its bytes for later splash screens.
+
+    Parameters
+    ----------
+    image_path : str or Path
+        Path to the image file.
+
+    Returns
+    -------
+    bytes
+        The raw contents of the image file.
+    """
+    with open(image_path, "rb") as f:
+        return f.read()
+
+
 class SplashScreen(tk.Toplevel):
     """Display Splash Screen
 
@@ -64,11 +83,13 @@ class SplashScreen(tk.Toplevel):
         # without navigation panel
         self.overrideredirect(True)
 
+        #: tk.PhotoImage: Splash image, referenced so Tk does not drop it.
+        self.image = None
         try:
-            img = tk.PhotoImage(file=image_path)
-            w, h = img.width(), img.height()  # width, height of the image
-            loading_label = tk.Label(self, image=img)
-        except tk.TclError:
+            self.image = tk.PhotoImage(data=read_image_bytes(image_path))
+            w, h = self.image.width(), self.image.height()
+            loading_label = tk.Label(self, image=self.image)
+        except (OSError, tk.TclError):
             w, h = 300, 100
             loading_label = tk.Label(self, text="Loading Navigate Software ...")
         loading_label.pack()
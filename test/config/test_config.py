@@ -80,6 +80,10 @@ def test_config_methods():
         "verify_positions_config",
         "verify_configuration",
         "yaml",
+        "YamlLoader",
+        "load_yaml_config",
+        "pickle",
+        "hashlib",
         "logging",
         "logger",
         "p",
@@ -850,3 +854,21 @@ class TestVerifyExperimentConfig(unittest.TestCase):
         new_positions = config.verify_positions_config(positions)
         assert isinstance(new_positions, list)
         assert len(new_positions) == 2
+
+
+def test_load_yaml_config_cache(tmp_path, monkeypatch):
+    """Test that a cached parse is reused until the YAML file changes."""
+    navigate_path = tmp_path / "navigate"
+    monkeypatch.setattr(config, "get_navigate_path", lambda: str(navigate_path))
+
+    file_path = tmp_path / "cached_config.yaml"
+    file_path.write_text("a: 1\n")
+    assert config.load_yaml_config(file_path) == {"a": 1}
+    assert len(list((navigate_path / "cache").glob("*.pkl"))) == 1
+
+    with patch("yaml.load") as mock_yaml_load:
+        assert config.load_yaml_config(file_path) == {"a": 1}
+        mock_yaml_load.assert_not_called()
+
+    file_path.write_text("a: 2\nb: 3\n")
+    assert config.load_yaml_config(file_path) == {"a": 2, "b": 3}
@@ -34,19 +34,31 @@
 from navigate.controller.sub_controllers.camera_view import CameraViewController
 import pytest
 import random
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 import numpy as np
 
+pytestmark = pytest.mark.xdist_group(name="camera_view")
+
 
 class TestCameraViewController:
+    @pytest.fixture(scope="class")
+    def camera_view_controller(self, dummy_controller):
+        # Build the Tk-backed controller once for the whole class.
+        return CameraViewController(
+            dummy_controller.view.camera_waveform.camera_tab, dummy_controller
+        )
+
     @pytest.fixture(autouse=True)
-    def setup_class(self, dummy_controller):
+    def setup_class(self, dummy_controller, camera_view_controller):
         c = dummy_controller
         self.v = dummy_controller.view
         c.model = MagicMock()
         c.model.get_offset_variance_maps = MagicMock(return_value=[None, None])
 
-        self.camera_view = CameraViewController(self.v.camera_waveform.camera_tab, c)
+        self.camera_view = camera_view_controller
+        # Tests reassign controller attributes directly, so restore them afterwards.
+        attributes = dict(vars(camera_view_controller))
 
         self.microscope_state = {
             "channels": {
@@ -95,6 +107,11 @@ class TestCameraViewController:
             "image_mode": "z-stack",
         }
 
+        yield
+
+        vars(camera_view_controller).clear()
+        vars(camera_view_controller).update(attributes)
+
     def test_init(self):
 
         assert isinstance(self.camera_view, CameraViewController)
@@ -126,7 +143,7 @@ class TestCameraViewController:
         # create a fake event object
         self.startx = int(random.random())
         self.starty = int(random.random())
-        event = type("Event", (object,), {"x": self.startx, "y": self.starty})()
+        event = SimpleNamespace(x=self.startx, y=self.starty)
         self.grab_released = False
         self.x = int(random.random())
         self.y = int(random.random())
@@ -456,15 +473,11 @@ class TestCameraViewController:
         self.zoom_image = test_image
 
         # set the widget size
-        widget = type("MyWidget", (object,), {"widget": self.camera_view.view})
-        event = type(
-            "MyEvent",
-            (object,),
-            {
-                "widget": widget,
-                "width": np.random.randint(5, 1000),
-                "height": np.random.randint(5, 1000),
-            },
+        widget = SimpleNamespace(widget=self.camera_view.view)
+        event = SimpleNamespace(
+            widget=widget,
+            width=np.random.randint(5, 1000),
+            height=np.random.randint(5, 1000),
         )
         self.camera_view.resize(event)
 
@@ -544,7 +557,8 @@ class TestCameraViewController:
 
         monkeypatch.setattr(ImageTk, "PhotoImage", mocked_PhotoImage)
 
-        self.camera_view.canvas.create_image = MagicMock()
+        # The canvas is shared by the whole class, so patch it reversibly.
+        monkeypatch.setattr(self.camera_view.canvas, "create_image", MagicMock())
         self.camera_view.image_cache_flag = True
 
         # Call the function
@@ -31,22 +31,33 @@
 #
 
 import pytest
+from types import SimpleNamespace
 from unittest.mock import MagicMock, call
 import numpy as np
 
+pytestmark = pytest.mark.xdist_group(name="stage")
+
 AXES = ["x", "y", "z", "theta", "f"]
 CAXES = ["xy", "z", "theta", "f"]
+# Positions outside the [2, 10] limits used in test_get_position
+OUT_OF_RANGE = np.concatenate((np.arange(-9, 0), np.arange(10, 20)))
+RNG = np.random.default_rng(0)
 
 
 def pos_dict(v, axes=AXES):
     return {k: v for k in axes}
 
 
-@pytest.fixture
-def stage_controller(dummy_controller):
+def random_pos_dict(low, high, axes=AXES):
+    return dict(zip(axes, RNG.integers(low, high, size=len(axes)).tolist()))
+
+
+@pytest.fixture(scope="module")
+def shared_stage_controller(dummy_controller):
     from navigate.controller.sub_controllers.stages import StageController
 
-    dummy_controller.camera_view_controller = MagicMock()
+    # StageController only takes the canvas; it never calls into it.
+    dummy_controller.camera_view_controller = SimpleNamespace(canvas=object())
 
     return StageController(
         dummy_controller.view.settings.stage_control_tab,
@@ -56,21 +67,57 @@ def stage_controller(dummy_controller):
     )
 
 
-# test before set position variables to MagicMock()
-def test_set_position(stage_controller):
+@pytest.fixture
+def stage_controller(shared_stage_controller):
+    # Tests assign mocks straight onto the controller, its view, the Tk
+    # variables and the entry widgets, so restore all of them afterwards.
+    view = shared_stage_controller.view
+    objects = [shared_stage_controller, view]
+    objects += list(shared_stage_controller.widget_vals.values())
+    objects += [w.widget for w in view.get_widgets().values()]
+    snapshots = [(obj, dict(vars(obj))) for obj in objects]
+
+    yield shared_stage_controller
+
+    for obj, attributes in snapshots:
+        vars(obj).clear()
+        vars(obj).update(attributes)
+
 
+@pytest.fixture(scope="module")
+def widget_val_mocks():
+    names = AXES + [axis + "_step" for axis in CAXES]
+    return {name: (MagicMock(), MagicMock()) for name in names}
+
+
+@pytest.fixture
+def mocked_widget_vals(stage_controller, widget_val_mocks):
+    # Reuse one get/set mock pair per variable instead of building new ones.
+    widget_vals = stage_controller.widget_vals
+    for name, (get_mock, set_mock) in widget_val_mocks.items():
+        get_mock.reset_mock(return_value=True, side_effect=True)
+        set_mock.reset_mock(return_value=True, side_effect=True)
+        widget_vals[name].get = get_mock
+        widget_vals[name].set = set_mock
+    return widget_vals
+
+
+@pytest.fixture
+def widgets_map(stage_controller):
     widgets = stage_controller.view.get_widgets()
-    vals = {}
     for axis in AXES:
         widgets[axis].widget.trigger_focusout_validation = MagicMock()
-        vals[axis] = np.random.randint(0, 9)
+    return widgets
+
+
+def test_set_position(stage_controller, widgets_map):
 
-    stage_controller.view.get_widgets = MagicMock(return_value=widgets)
+    widgets = widgets_map
     stage_controller.show_verbose_info = MagicMock()
     position = {
-        "x": np.random.random(),
-        "y": np.random.random(),
-        "z": np.random.random(),
+        "x": RNG.random(),
+        "y": RNG.random(),
+        "z": RNG.random(),
     }
     stage_controller.set_position(position)
     for axis in position.keys():
@@ -82,20 +129,14 @@ def test_set_position(stage_controller):
     )
 
 
-def test_set_position_silent(stage_controller):
+def test_set_position_silent(stage_controller, widgets_map):
 
-    widgets = stage_controller.view.get_widgets()
-    vals = {}
-    for axis in AXES:
-        widgets[axis].widget.trigger_focusout_validation = MagicMock()
-        vals[axis] = np.random.randint(0, 9)
-
-    stage_controller.view.get_widgets = MagicMock(return_value=widgets)
+    widgets = widgets_map
     stage_controller.show_verbose_info = MagicMock()
     position = {
-        "x": np.random.random(),
-        "y": np.random.random(),
-        "z": np.random.random(),
+        "x": RNG.random(),
+        "y": RNG.random(),
+        "z": RNG.random(),
     }
     stage_controller.set_position_silent(position)
     for axis in position.keys():
@@ -109,11 +150,17 @@ def test_set_position_silent(stage_controller):
     )
 
 
+@pytest.mark.parametrize(
+    "char, axis, direction",
+    [("w", "y", 1), ("a", "x", -1), ("s", "y", -1), ("d", "x", 1)],
+)
 @pytest.mark.parametrize(
     "flip_x, flip_y",
     [(False, False), (True, False), (True, True), (False, True), (True, True)],
 )
-def test_stage_key_press(stage_controller, flip_x, flip_y):
+def test_stage_key_press(
+    stage_controller, mocked_widget_vals, char, axis, direction, flip_x, flip_y
+):
     microscope_name = (
         stage_controller.parent_controller.configuration_controller.microscope_name
     )
@@ -123,55 +170,34 @@ def test_stage_key_press(stage_controller, flip_x, flip_y):
     stage_config["flip_x"] = flip_x
     stage_config["flip_y"] = flip_y
     stage_controller.initialize()
-    x = round(np.random.random(), 1)
-    y = round(np.random.random(), 1)
-    increment = round(np.random.random() + 1, 1)
-    stage_controller.widget_vals["xy_step"].get = MagicMock(return_value=increment)
-    stage_controller.widget_vals["x"].get = MagicMock(return_value=x)
-    stage_controller.widget_vals["x"].set = MagicMock()
-    stage_controller.widget_vals["y"].get = MagicMock(return_value=y)
-    stage_controller.widget_vals["y"].set = MagicMock()
+    pos = round(RNG.random(), 1)
+    increment = round(RNG.random() + 1, 1)
+    mocked_widget_vals["xy_step"].get.return_value = increment
+    mocked_widget_vals[axis].get.return_value = pos
     event = MagicMock()
+    event.char = char
+    # <a> instead of <Control+a>
+    event.state = 0
 
-    axes_map = {"w": "y", "a": "x", "s": "y", "d": "x"}
-
-    for char, xs, ys in zip(
-        ["w", "a", "s", "d"],
-        [0, -increment, 0, increment],
-        [increment, 0, -increment, 0],
-    ):
-        event.char = char
-        # <a> instead of <Control+a>
-        event.state = 0
-        axis = axes_map[char]
-        if axis == "x":
-            temp = x + xs * (-1 if flip_x else 1)
-        else:
-            temp = y + ys * (-1 if flip_y else 1)
-        stage_controller.stage_key_press(event)
-        stage_controller.widget_vals[axis].set.assert_called_once_with(temp)
-        stage_controller.widget_vals[axis].set.reset_mock()
-        stage_controller.widget_vals[axis].get.reset_mock()
-        stage_controller.widget_vals["xy_step"].get.reset_mock()
+    flip = flip_x if axis == "x" else flip_y
+    temp = pos + direction * increment * (-1 if flip else 1)
+    stage_controller.stage_key_press(event)
+    stage_controller.widget_vals[axis].set.assert_called_once_with(temp)
 
     stage_config["flip_x"] = False
     stage_config["flip_y"] = False
 
 
-def test_get_position(stage_controller):
+def test_get_position(stage_controller, mocked_widget_vals):
     import tkinter as tk
 
-    vals = {}
+    vals = random_pos_dict(0, 9)
     for axis in AXES:
-        vals[axis] = np.random.randint(0, 9)
-        stage_controller.widget_vals[axis].get = MagicMock(return_value=vals[axis])
+        mocked_widget_vals[axis].get.return_value = vals[axis]
 
-    step_vals = {}
+    step_vals = random_pos_dict(1, 9, axes=CAXES)
     for axis in CAXES:
-        step_vals[axis] = np.random.randint(1, 9)
-        stage_controller.widget_vals[axis + "_step"].get = MagicMock(
-            return_value=step_vals[axis]
-        )
+        mocked_widget_vals[axis + "_step"].get.return_value = step_vals[axis]
 
     stage_controller.position_min = pos_dict(0)
     stage_controller.position_max = pos_dict(10)
@@ -180,12 +206,9 @@ def test_get_position(stage_controller):
 
     stage_controller.position_min = pos_dict(2)
 
-    vals = {}
+    vals = dict(zip(AXES, RNG.choice(OUT_OF_RANGE, size=len(AXES)).tolist()))
     for axis in AXES:
-        vals[axis] = np.random.choice(
-            np.concatenate((np.arange(-9, 0), np.arange(10, 20)))
-        )
-        stage_controller.widget_vals[axis].get = MagicMock(return_value=vals[axis])
+        mocked_widget_vals[axis].get.return_value = vals[axis]
 
     position = stage_controller.get_position()
     assert position is None
@@ -195,6 +218,7 @@ def test_get_position(stage_controller):
     assert position is None
 
 
+@pytest.mark.parametrize("axis", AXES)
 @pytest.mark.parametrize(
     "flip_x, flip_y, flip_z",
     [
@@ -205,7 +229,9 @@ def test_get_position(stage_controller):
         (True, True, True),
     ],
 )
-def test_up_btn_handler(stage_controller, flip_x, flip_y, flip_z):
+def test_up_btn_handler(
+    stage_controller, mocked_widget_vals, axis, flip_x, flip_y, flip_z
+):
     microscope_name = (
         stage_controller.parent_controller.configuration_controller.microscope_name
     )
@@ -220,47 +246,33 @@ def test_up_btn_handler(stage_controller, flip_x, flip_y, flip_z):
         stage_controller.parent_controller.configuration_controller.stage_flip_flags
     )
 
-    vals = {}
-    for axis in AXES:
-        vals[axis] = np.random.randint(1, 9)
-        stage_controller.widget_vals[axis].get = MagicMock(return_value=vals[axis])
-        stage_controller.widget_vals[axis].set = MagicMock()
-
-    step_vals = {}
-    for axis in CAXES:
-        step_vals[axis] = np.random.randint(1, 9)
-        stage_controller.widget_vals[axis + "_step"].get = MagicMock(
-            return_value=step_vals[axis]
-        )
+    step_axis = "xy" if axis in ("x", "y") else axis
+    pos = RNG.integers(1, 9)
+    step = RNG.integers(1, 9)
+    mocked_widget_vals[axis].get.return_value = pos
+    mocked_widget_vals[step_axis + "_step"].get.return_value = step
 
     stage_controller.position_max = pos_dict(10)
 
-    # Test for each axis
-    for axis in AXES:
-        pos = stage_controller.widget_vals[axis].get()
-        if axis == "x" or axis == "y":
-            step = stage_controller.widget_vals["xy_step"].get()
-        else:
-            step = stage_controller.widget_vals[axis + "_step"].get()
-        temp = pos + step * (-1 if flip_flags[axis] else 1)
-        if temp > stage_controller.position_max[axis]:
-            temp = stage_controller.position_max[axis]
-        stage_controller.up_btn_handler(axis)()
-        stage_controller.widget_vals[axis].set.assert_called_once_with(temp)
+    temp = pos + step * (-1 if flip_flags[axis] else 1)
+    if temp > stage_controller.position_max[axis]:
+        temp = stage_controller.position_max[axis]
+    stage_controller.up_btn_handler(axis)()
+    stage_controller.widget_vals[axis].set.assert_called_once_with(temp)
 
     # Test for out of limit condition
-    for axis in AXES:
-        stage_controller.widget_vals[axis].set.reset_mock()
-        stage_controller.widget_vals[axis].get.return_value = 10
-        stage_controller.up_btn_handler(axis)()
-        if flip_flags[axis] is False:
-            stage_controller.widget_vals[axis].set.assert_not_called()
+    stage_controller.widget_vals[axis].set.reset_mock()
+    stage_controller.widget_vals[axis].get.return_value = 10
+    stage_controller.up_btn_handler(axis)()
+    if flip_flags[axis] is False:
+        stage_controller.widget_vals[axis].set.assert_not_called()
 
     stage_config["flip_x"] = False
     stage_config["flip_y"] = False
     stage_config["flip_z"] = False
 
 
+@pytest.mark.parametrize("axis", AXES)
 @pytest.mark.parametrize(
     "flip_x, flip_y, flip_z",
     [
@@ -271,7 +283,9 @@ def test_up_btn_handler(stage_controller, flip_x, flip_y, flip_z):
         (True, True, True),
     ],
 )
-def test_down_btn_handler(stage_controller, flip_x, flip_y, flip_z):
+def test_down_btn_handler(
+    stage_controller, mocked_widget_vals, axis, flip_x, flip_y, flip_z
+):
     microscope_name = (
         stage_controller.parent_controller.configuration_controller.microscope_name
     )
@@ -285,41 +299,27 @@ def test_down_btn_handler(stage_controller, flip_x, flip_y, flip_z):
     flip_flags = (
         stage_controller.parent_controller.configuration_controller.stage_flip_flags
     )
-    vals = {}
-    for axis in AXES:
-        vals[axis] = np.random.randint(1, 9)
-        stage_controller.widget_vals[axis].get = MagicMock(return_value=vals[axis])
-        stage_controller.widget_vals[axis].set = MagicMock()
 
-    step_vals = {}
-    for axis in CAXES:
-        step_vals[axis] = np.random.randint(1, 9)
-        stage_controller.widget_vals[axis + "_step"].get = MagicMock(
-            return_value=step_vals[axis]
-        )
+    step_axis = "xy" if axis in ("x", "y") else axis
+    pos = RNG.integers(1, 9)
+    step = RNG.integers(1, 9)
+    mocked_widget_vals[axis].get.return_value = pos
+    mocked_widget_vals[step_axis + "_step"].get.return_value = step
 
     stage_controller.position_min = pos_dict(0)
 
-    # Test for each axis
-    for axis in AXES:
-        pos = stage_controller.widget_vals[axis].get()
-        if axis == "x" or axis == "y":
-            step = stage_controller.widget_vals["xy_step"].get()
-        else:
-            step = stage_controller.widget_vals[axis + "_step"].get()
-        temp = pos - step * (-1 if flip_flags[axis] else 1)
-        if temp < stage_controller.position_min[axis]:
-            temp = stage_controller.position_min[axis]
-        stage_controller.down_btn_handler(axis)()
-        stage_controller.widget_vals[axis].set.assert_called_once_with(temp)
+    temp = pos - step * (-1 if flip_flags[axis] else 1)
+    if temp < stage_controller.position_min[axis]:
+        temp = stage_controller.position_min[axis]
+    stage_controller.down_btn_handler(axis)()
+    stage_controller.widget_vals[axis].set.assert_called_once_with(temp)
 
     # Test for out of limit condition
-    for axis in ["x", "y", "z", "theta", "f"]:
-        stage_controller.widget_vals[axis].set.reset_mock()
-        stage_controller.widget_vals[axis].get.return_value = 0
-        stage_controller.down_btn_handler(axis)()
-        if flip_flags[axis] is False:
-            stage_controller.widget_vals[axis].set.assert_not_called()
+    stage_controller.widget_vals[axis].set.reset_mock()
+    stage_controller.widget_vals[axis].get.return_value = 0
+    stage_controller.down_btn_handler(axis)()
+    if flip_flags[axis] is False:
+        stage_controller.widget_vals[axis].set.assert_not_called()
 
     stage_config["flip_x"] = False
     stage_config["flip_y"] = False
@@ -335,20 +335,17 @@ def test_stop_button_handler(stage_controller):
     stage_controller.view.after.assert_called_once()
 
 
-def test_position_callback(stage_controller):
+def test_position_callback(stage_controller, mocked_widget_vals, widgets_map):
 
     stage_controller.show_verbose_info = MagicMock()
 
     stage_controller.view.after = MagicMock()
 
-    vals = {}
-    widgets = stage_controller.view.get_widgets()
+    vals = random_pos_dict(1, 9)
+    widgets = widgets_map
     for axis in AXES:
-        vals[axis] = np.random.randint(1, 9)
-        stage_controller.widget_vals[axis].get = MagicMock(return_value=vals[axis])
-        stage_controller.widget_vals[axis].set = MagicMock()
+        mocked_widget_vals[axis].get.return_value = vals[axis]
         widgets[axis].widget.set(vals[axis])
-        widgets[axis].widget.trigger_focusout_validation = MagicMock()
 
     stage_controller.position_min = pos_dict(0)
     stage_controller.position_max = pos_dict(10)
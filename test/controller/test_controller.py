@@ -554,6 +554,23 @@ def test_capture_image(controller):
     assert True
 
 
+def test_capture_image_refreshes_histogram_with_last_frame(controller):
+    image_ids = iter([0, 1, 2, "stop"])
+    controller.data_buffer = numpy.random.rand(3, 4, 4)
+    controller.threads_pool.createThread = MagicMock()
+    controller.show_img_pipe.recv = lambda: next(image_ids)
+    controller.camera_view_controller.try_to_display_image = MagicMock()
+    controller.mip_setting_controller.try_to_display_image = MagicMock()
+    controller.histogram_controller.populate_histogram = MagicMock()
+    controller.stop_acquisition_flag = False
+
+    controller.capture_image("acquire", "continuous")
+
+    # frames 1 and 2 arrive within one refresh interval of frame 0
+    _, kwargs = controller.histogram_controller.populate_histogram.call_args
+    assert numpy.array_equal(kwargs["image"], controller.data_buffer[2])
+
+
 def test_launch_additional_microscope():
     # This looks awful to test...
     pass
@@ -267,3 +267,24 @@ def test_bdv_getitem(multiposition, per_stack, z_stack, size):
     close_bdv_ds(ds)
 
     assert True
+
+
+def test_bdv_shapes_follow_metadata_update():
+    from test.model.dummy import DummyModel
+    from navigate.model.data_sources.bdv_data_source import BigDataViewerDataSource
+
+    model = DummyModel()
+    model.configuration["experiment"]["MicroscopeState"]["image_mode"] = "z-stack"
+    model.configuration["experiment"]["MicroscopeState"]["number_z_steps"] = 2
+
+    ds = BigDataViewerDataSource("test.h5")
+    ds.set_metadata_from_configuration_experiment(model.configuration)
+    ds.nbytes
+
+    model.configuration["experiment"]["MicroscopeState"]["number_z_steps"] = 3
+    ds.set_metadata_from_configuration_experiment(model.configuration)
+    assert ds._shape_tuples is None
+
+    ds.nbytes
+    assert ds._shape_tuples == tuple(tuple(shape) for shape in ds.shapes.tolist())
+    assert ds._shape_tuples[0][0] == ds.shape_z
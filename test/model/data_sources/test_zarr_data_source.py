@@ -150,3 +150,30 @@ def test_zarr_write(multiposition, per_stack, z_stack, stop_early, size):
     close_zarr_ds(ds, file_name=file_name)
 
     assert True
+
+
+@pytest.mark.parametrize("multiposition", [True, False])
+@pytest.mark.parametrize("z_stack", [True, False])
+def test_zarr_getitem(multiposition, z_stack):
+    fn = "test.zarr"
+
+    ds = zarr_ds(fn, multiposition, True, z_stack, False, (512, 256))
+
+    sliced_ds = ds[:, :, :, :, :, :]
+    assert sliced_ds.shape == (
+        ds.positions,
+        ds.shape_t,
+        ds.shape_z,
+        ds.shape_c,
+        ds.shape_y,
+        ds.shape_x,
+    )
+    for p in range(ds.positions):
+        for t in range(ds.shape_t):
+            for c in range(ds.shape_c):
+                np.testing.assert_array_equal(
+                    sliced_ds[p, t, :, c, :, :],
+                    ds.get_slice(slice(None), slice(None), c, slice(None), t, p),
+                )
+
+    close_zarr_ds(ds)
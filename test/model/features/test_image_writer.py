@@ -1,48 +1,50 @@
 import os
+
+import numpy as np
 import pytest
 
-from navigate.tools.file_functions import delete_folder
+pytestmark = pytest.mark.xdist_group(name="image_writer")
 
 
 @pytest.fixture()
-def image_writer(dummy_model):
+def image_writer(dummy_model, tmp_path, monkeypatch):
     from navigate.model.features.image_writer import ImageWriter
 
     model = dummy_model
-    model.configuration["experiment"]["Saving"]["save_directory"] = "test_save_dir"
+    model.configuration["experiment"]["Saving"]["save_directory"] = str(tmp_path)
+
+    # Save small frames; the full-size camera buffer only slows the test down.
+    camera_parameters = model.configuration["experiment"]["CameraParameters"][
+        model.active_microscope_name
+    ]
+    monkeypatch.setitem(camera_parameters, "img_x_pixels", 64)
+    monkeypatch.setitem(camera_parameters, "img_y_pixels", 32)
+    data_buffer = np.zeros((model.number_of_frames, 32, 64))
 
-    writer = ImageWriter(dummy_model)
+    writer = ImageWriter(dummy_model, data_buffer=data_buffer)
 
     yield writer
 
     writer.close()
 
 
-def test_image_write_fail(image_writer):
-    image_writer.save_image([-1, image_writer.model.data_buffer.shape[0]])
+def test_image_write_fail(image_writer, tmp_path):
+    image_writer.save_image([-1, image_writer.data_buffer.shape[0]])
 
     # make sure the directory is empty
-    ls = os.listdir("test_save_dir")
+    ls = os.listdir(tmp_path)
     ls.remove("MIP")
     assert not ls
 
-    delete_folder("test_save_dir")
-
-
-def test_image_write(image_writer):
-    from numpy.random import rand
 
+def test_image_write(image_writer, tmp_path):
     # Randomize the data buffer
-    for i in range(image_writer.model.data_buffer.shape[0]):
-        image_writer.model.data_buffer[i, ...] = rand(
-            image_writer.model.img_width, image_writer.model.img_height
-        )
+    data_buffer = image_writer.data_buffer
+    data_buffer[...] = np.random.default_rng(0).random(data_buffer.shape)
 
     image_writer.save_image(list(range(image_writer.model.number_of_frames)))
 
     # make sure the directory isn't empty
-    ls = os.listdir("test_save_dir")
+    ls = os.listdir(tmp_path)
     ls.remove("MIP")
     assert ls
-
-    delete_folder("test_save_dir")
@@ -65,6 +65,14 @@ def test_prepare_acquisition(dummy_microscope):
             filter(lambda k: channels[k]["is_selected"], channels.keys()),
         )
     )
+    available_channels = dummy_microscope.available_channels
+    assert dummy_microscope.next_channel[0] == (
+        available_channels[0],
+        f"channel_{available_channels[0]}",
+    )
+    for i, idx in enumerate(available_channels):
+        next_idx = available_channels[(i + 1) % len(available_channels)]
+        assert dummy_microscope.next_channel[idx] == (next_idx, f"channel_{next_idx}")
     assert dummy_microscope.camera.is_acquiring is True
     assert dummy_microscope.shutter.shutter_state is True
     assert isinstance(waveform_dict, dict)
@@ -155,6 +155,34 @@ def test_live_acquisition(model):
     model.release_pipe("show_img_pipe")
 
 
+def test_update_setting_during_live_acquisition(model):
+    state = model.configuration["experiment"]["MicroscopeState"]
+    state["image_mode"] = "live"
+
+    n_images = 0
+    signal_thread = None
+
+    show_img_pipe = model.create_pipe("show_img_pipe")
+
+    model.run_command("acquire")
+
+    while True:
+        image_id = show_img_pipe.recv()
+        if image_id == "stop":
+            break
+        n_images += 1
+        if n_images == 10:
+            signal_thread = model.signal_thread
+            model.run_command("update_setting", "none")
+            # the live signal thread is paused and resumed, not restarted
+            assert model.signal_thread is signal_thread
+            assert model.ask_to_pause_signal_thread is False
+        elif n_images >= 20:
+            model.run_command("stop")
+    model.data_thread.join()
+    model.release_pipe("show_img_pipe")
+
+
 def test_autofocus_live_acquisition(model):
     state = model.configuration["experiment"]["MicroscopeState"]
     state["image_mode"] = "live"
@@ -272,6 +300,40 @@ def test_multiposition_acquisition(model):
     model.release_pipe("show_img_pipe")
 
 
+def test_wait_for_writer(model):
+    saved_frames = []
+
+    model.submit_write(saved_frames.extend, [0, 1])
+    model.submit_write(saved_frames.extend, [2])
+    model.wait_for_writer()
+
+    assert saved_frames == [0, 1, 2]
+    assert model.last_write is None
+
+
+def test_wait_for_writer_raises_any_failed_write(model):
+    def fail(frame_ids):
+        raise OSError("disk full")
+
+    model.submit_write(fail, [0])
+    model.submit_write(lambda frame_ids: None, [1])
+
+    with pytest.raises(OSError):
+        model.wait_for_writer()
+    assert model.last_write is None
+    assert model.write_error is None
+    # the first failed save stops the acquisition
+    assert model.stop_acquisition is True
+    model.stop_acquisition = False
+    model.stop_send_signal = False
+
+    # every slot is handed back, even for failed writes
+    for _ in range(model.writer_slots_size):
+        assert model.writer_slots.acquire(blocking=False)
+    for _ in range(model.writer_slots_size):
+        model.writer_slots.release()
+
+
 def test_change_resolution(model):
     """
     Note: The stage position check is an absolute mess due to us instantiating two
@@ -55,6 +55,7 @@ def get_args():
     args.gui_config_file = False
     args.logging_config = False
     args.synthetic_hardware = True
+    args.no_splash = False
     return args
 
 
@@ -88,7 +89,7 @@ class TestMainController(unittest.TestCase):
     """Unit Test for main.py"""
 
     @patch("navigate.main.tk.Tk.mainloop")
-    @patch("navigate.main.Controller")
+    @patch("navigate.controller.controller.Controller")
     @patch("argparse.ArgumentParser.parse_args")
     def test_main_call_controller(
         self, mock_parse_args, mock_controller, mock_mainloop
@@ -104,7 +105,7 @@ class TestMainController(unittest.TestCase):
 # class TestMainConfigurator(unittest.TestCase):
 #     """ Unit Test for main.py """
 #     @patch('navigate.main.tk.Tk.mainloop')
-#     @patch('navigate.main.Controller')
+#     @patch('navigate.controller.controller.Controller')
 #     @patch('argparse.ArgumentParser.parse_args')
 #     def test_main_configurator(
 #             self,
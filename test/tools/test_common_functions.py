@@ -120,6 +120,16 @@ class CopyProxyObjectTestCase(unittest.TestCase):
         assert copied_list[0] == "item1"
         assert copied_list[1] == {"key": "value"}
 
+    def test_copy_proxy_object_with_nested_proxies(self):
+        manager = Manager()
+        inner_list = manager.list([1, 2])
+        inner_dict = manager.dict({"list": inner_list})
+        original_dict = manager.dict({"dict": inner_dict, "value": None})
+        copied_dict = common_functions.copy_proxy_object(original_dict)
+        assert copied_dict == {"dict": {"list": [1, 2]}, "value": None}
+        assert type(copied_dict["dict"]) is dict
+        assert type(copied_dict["dict"]["list"]) is list
+
     def test_copy_proxy_object_with_non_proxy_object(self):
         non_proxy_object = {"key": "value"}
         copied_object = common_functions.copy_proxy_object(non_proxy_object)
@@ -28,3 +28,24 @@ def test_ensure_slice():
     ensure_slice(2, 1) == slice(None, None, None)
     ensure_slice(slice(0, 2), 0) == slice(0, 2, None)
     ensure_slice(slice(0, 2), 1) == slice(None, None, None)
+
+def test_normalize_keys():
+    from navigate.tools.slicing import normalize_keys, ensure_slice, ensure_iter
+
+    shape = (8, 8, 3, 5, 4, 2)
+    for keys in [
+        2,
+        slice(0, 2),
+        (slice(None), 3),
+        (slice(None), slice(None), 1, ...),
+        (0, 1, slice(0, 2), slice(1, 4), 7, slice(None)),
+        (slice(None), slice(None), slice(None), 0, slice(None), 1, 2),
+    ]:
+        xs, ys, cs, zs, ts, ps, sub = normalize_keys(keys, shape)
+        assert xs == ensure_slice(keys, 0)
+        assert ys == ensure_slice(keys, 1)
+        assert cs == ensure_iter(keys, 2, shape[2])
+        assert zs == ensure_slice(keys, 3)
+        assert ts == ensure_iter(keys, 4, shape[4])
+        assert ps == ensure_iter(keys, 5, shape[5])
+        assert sub == (keys[6] if isinstance(keys, tuple) and len(keys) > 6 else 0)
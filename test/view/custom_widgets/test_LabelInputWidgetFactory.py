@@ -18,3 +18,16 @@ def test_label_input_get():
     assert label_input.get() == ""
     assert label_input.get(1) == 1
     root.destroy()
+
+
+def test_label_input_set_ttk_checkbutton():
+    from tkinter import ttk
+    from navigate.view.custom_widgets.LabelInputWidgetFactory import LabelInput
+
+    root = tk.Tk()
+    label_input = LabelInput(root, input_class=ttk.Checkbutton)
+    label_input.set(True)
+    assert label_input.widget.instate(["selected"])
+    label_input.set(False)
+    assert not label_input.widget.instate(["selected"])
+    root.destroy()